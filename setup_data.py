@@ -12,26 +12,91 @@ This script helps you:
 Usage:
     python setup_data.py --help
     python setup_data.py create-sample
+    python setup_data.py freeze-sample
     python setup_data.py validate path/to/data.xlsx
     python setup_data.py export-json path/to/data.xlsx
 """
 
+import hashlib
+import importlib.util
 import json
 import os
+import pickle
+import subprocess
 import sys
+from array import array
+from collections import Counter, defaultdict, namedtuple
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+REQUIRED_PACKAGES = ('pandas', 'openpyxl')
+
+
+def _missing_packages(packages=REQUIRED_PACKAGES):
+    """Return the packages that cannot be imported."""
+    return [pkg for pkg in packages if importlib.util.find_spec(pkg) is None]
+
+
+def _ensure_deps():
+    """Install any missing required packages (only run with --install-deps)."""
+    missing = _missing_packages()
+    if missing:
+        print(f"Installing required packages: {', '.join(missing)}...")
+        subprocess.run([sys.executable, '-m', 'pip', 'install', *missing, '--break-system-packages'], check=True)
+        # Let this process's import system see the freshly installed packages
+        importlib.invalidate_caches()
+
+
+def _require(*packages):
+    """Exit with install instructions if a package a command needs is missing.
+
+    pandas and openpyxl are imported inside the functions that use them, so
+    commands like schema never pay for (or need) them.
+    """
+    missing = _missing_packages(packages)
+    if missing:
+        print(f"❌ Missing required package: {', '.join(missing)}")
+        print(f"   Install with: pip install {' '.join(REQUIRED_PACKAGES)}  (or rerun with --install-deps)")
+        sys.exit(1)
+
+
+@lru_cache(maxsize=None)
+def _header_style():
+    """Header font, fill, border and alignment, built once and shared by every header cell."""
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    thin = Side(style='thin')
+    return (Font(bold=True, color='FFFFFF', size=11),
+            PatternFill('solid', fgColor='4472C4'),
+            Border(left=thin, right=thin, top=thin, bottom=thin),
+            Alignment(horizontal='center'))
 
-# Check for required packages
-try:
-    import pandas as pd
-    from openpyxl import Workbook, load_workbook
-    from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-except ImportError:
-    print("Installing required packages...")
-    os.system(f"{sys.executable} -m pip install pandas openpyxl --break-system-packages")
-    import pandas as pd
-    from openpyxl import Workbook, load_workbook
-    from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+
+# Optional Rust-backed writer (pip install rustpy-xlsxwriter) - much faster than
+# openpyxl for plain tabular sheets like SAMPLE_DATA. It is fed DataFrames, so
+# it also needs pandas. It stores integer cells as whole floats (1.0); export-json
+# reads INTEGER_COLUMNS back as ints, so its output is the same for both writers.
+HAS_FAST_EXCEL = (importlib.util.find_spec('rustpy_xlsxwriter') is not None
+                  and importlib.util.find_spec('pandas') is not None)
+
+# Optional Rust-backed Excel reader (pip install python-calamine) - parses
+# workbooks for validation ~10x faster than openpyxl. pandas only accepts
+# engine='calamine' from 2.2 on; _read_sheets checks that once pandas is loaded.
+HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+
+@lru_cache(maxsize=None)
+def _json_dumps():
+    """Return the indented UTF-8 JSON bytes encoder for export-json.
+
+    Uses orjson when installed (pip install orjson); it is imported here so
+    commands that never export don't pay for it.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 
 
 # ============================================================================
@@ -47,26 +112,31 @@ SHEET_SCHEMAS = {
     'Topics': {
         'columns': ['topic_id', 'subject_key', 'topic_name', 'duration_minutes', 'order_index'],
         'required': ['topic_id', 'subject_key', 'topic_name'],
+        'references': {'subject_key': ('Subjects', 'subject_key')},
         'description': 'List all topics per subject'
     },
     'Topic_Sections': {
         'columns': ['section_id', 'topic_id', 'section_title', 'section_icon', 'order_index', 'section_type'],
         'required': ['section_id', 'topic_id', 'section_title'],
+        'references': {'topic_id': ('Topics', 'topic_id')},
         'description': 'Define sections/chapters within each topic'
     },
     'Learning_Objectives': {
         'columns': ['objective_id', 'topic_id', 'objective_text', 'order_index'],
         'required': ['objective_id', 'topic_id', 'objective_text'],
+        'references': {'topic_id': ('Topics', 'topic_id')},
         'description': 'Learning objectives for each topic'
     },
     'Key_Terms': {
         'columns': ['term_id', 'topic_id', 'term', 'definition'],
         'required': ['term_id', 'topic_id', 'term', 'definition'],
+        'references': {'topic_id': ('Topics', 'topic_id')},
         'description': 'Vocabulary terms and definitions'
     },
     'Study_Content': {
         'columns': ['content_id', 'section_id', 'content_type', 'content_title', 'content_text', 'order_index', 'image_url', 'video_url'],
         'required': ['content_id', 'section_id', 'content_type', 'content_text'],
+        'references': {'section_id': ('Topic_Sections', 'section_id')},
         'description': 'Main educational content blocks'
     },
     'Formulas': {
@@ -75,12 +145,14 @@ SHEET_SCHEMAS = {
                    'variable_2_symbol', 'variable_2_name', 'variable_2_unit',
                    'variable_3_symbol', 'variable_3_name', 'variable_3_unit'],
         'required': ['formula_id', 'topic_id', 'formula_text'],
+        'references': {'topic_id': ('Topics', 'topic_id')},
         'description': 'Mathematical/scientific formulas'
     },
     'Quiz_Questions': {
         'columns': ['question_id', 'topic_id', 'question_text', 'option_a', 'option_b', 'option_c', 'option_d', 
                    'correct_answer', 'explanation', 'xp_reward'],
         'required': ['question_id', 'topic_id', 'question_text', 'option_a', 'option_b', 'correct_answer'],
+        'references': {'topic_id': ('Topics', 'topic_id')},
         'description': 'Multiple choice quiz questions'
     },
     'Achievements': {
@@ -90,35 +162,113 @@ SHEET_SCHEMAS = {
     }
 }
 
-CONTENT_TYPES = ['introduction', 'formula', 'concept_helper', 'warning', 'real_world', 'text', 'video', 'image', 'flowchart']
-SECTION_TYPES = ['objectives', 'intro', 'content', 'applications', 'quiz']
-VALID_ICONS = ['Zap', 'Calculator', 'FlaskConical', 'Leaf', 'Trophy', 'Star', 'Award', 'Flame',
-               'HelpCircle', 'CheckCircle2', 'Target', 'BookOpen', 'FileText', 'Clock', 'Globe',
-               'Lightbulb', 'AlertTriangle', 'Atom', 'Microscope', 'Dna', 'Pi', 'Hammer', 'RefreshCw',
-               'Minimize2', 'Triangle', 'Disc', 'Grid', 'ArrowDown', 'Link', 'GitCommit', 'Circle',
-               'GitBranch', 'Share2']
+# Ordered tuples for help/error text; frozensets for O(1) membership checks
+CONTENT_TYPES_ORDER = ('introduction', 'formula', 'concept_helper', 'warning', 'real_world', 'text', 'video', 'image', 'flowchart')
+SECTION_TYPES_ORDER = ('objectives', 'intro', 'content', 'applications', 'quiz')
+VALID_ICONS_ORDER = ('Zap', 'Calculator', 'FlaskConical', 'Leaf', 'Trophy', 'Star', 'Award', 'Flame',
+                     'HelpCircle', 'CheckCircle2', 'Target', 'BookOpen', 'FileText', 'Clock', 'Globe',
+                     'Lightbulb', 'AlertTriangle', 'Atom', 'Microscope', 'Dna', 'Pi', 'Hammer', 'RefreshCw',
+                     'Minimize2', 'Triangle', 'Disc', 'Grid', 'ArrowDown', 'Link', 'GitCommit', 'Circle',
+                     'GitBranch', 'Share2')
+CONTENT_TYPES = frozenset(CONTENT_TYPES_ORDER)
+SECTION_TYPES = frozenset(SECTION_TYPES_ORDER)
+VALID_ICONS = frozenset(VALID_ICONS_ORDER)
+# Content types the handout view can render (checked by validate-coverage)
+HANDOUT_CONTENT_TYPES = frozenset({'formula', 'concept_helper', 'warning', 'real_world', 'flowchart', 'image'})
+# Per-sheet vocabulary checks for validate: sheet -> (column, valid values, warning)
+VOCABULARY_CHECKS = {
+    'Study_Content': ('content_type', CONTENT_TYPES, f"Invalid content_type '{{}}'. Valid: {list(CONTENT_TYPES_ORDER)}"),
+    'Subjects': ('icon', VALID_ICONS, "Unknown icon '{}'"),
+    'Topic_Sections': ('section_icon', VALID_ICONS, "Unknown icon '{}'"),
+    'Achievements': ('icon', VALID_ICONS, "Unknown icon '{}'"),
+}
 
 
 # ============================================================================
 # SAMPLE DATA
 # ============================================================================
 
+# Sheets are stored column-wise (one list per schema column) so the writers can
+# emit whole columns without walking a dict per row.
+# Integer columns are stored as compact machine-int arrays rather than lists
+INTEGER_COLUMNS = frozenset({'order_index', 'duration_minutes', 'xp_reward'})
+
+
+def _int_values(values, sheet_name, col):
+    """Coerce an integer column's new values to an array('i'); '' and None become 0."""
+    ints = array('i')
+    for value in values:
+        try:
+            ints.append(0 if value is None or value == '' else int(value))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"{sheet_name}.{col}: {value!r} is not a whole number") from None
+    return ints
+
+
+def _empty_table(sheet_name):
+    """Return an empty column buffer for a sheet: {column: [] or array('i')}."""
+    return {col: array('i') if col in INTEGER_COLUMNS else []
+            for col in SHEET_SCHEMAS[sheet_name]['columns']}
+
+
+# Per-sheet row getters (one C-level multi-key fetch per row) and the blank
+# defaults used to fill in any column a literal row leaves out.
+ROW_GETTERS = {name: itemgetter(*schema['columns']) for name, schema in SHEET_SCHEMAS.items()}
+ROW_DEFAULTS = {name: {col: 0 if col in INTEGER_COLUMNS else '' for col in schema['columns']}
+                for name, schema in SHEET_SCHEMAS.items()}
+
+
+# Enum-like columns whose few distinct values repeat on many rows. Their values
+# are interned so every row shares one string object per value.
+INTERNED_COLUMNS = frozenset({'subject_key', 'topic_id', 'icon', 'section_icon', 'section_type', 'content_type',
+                              'correct_answer', 'variable_1_unit', 'variable_2_unit', 'variable_3_unit'})
+
+
+def _table_from_rows(sheet_name, rows):
+    """Convert a list of row dicts into a column buffer for a sheet."""
+    table = _empty_table(sheet_name)
+    get_row, defaults = ROW_GETTERS[sheet_name], ROW_DEFAULTS[sheet_name]
+    column_values = zip(*(get_row({**defaults, **row}) for row in rows))
+    for col, values in zip(table, column_values):
+        if col in INTEGER_COLUMNS:
+            values = _int_values(values, sheet_name, col)
+        table[col].extend(map(sys.intern, values) if col in INTERNED_COLUMNS else values)
+    return table
+
+
+def _intern_table(table, pool):
+    """Canonicalise a finished table's list columns in place through pool.
+
+    Each distinct value (e.g. a section_id repeated on every content row) is
+    then stored once; the columns stay lists, so later topics can be appended.
+    """
+    for values in table.values():
+        if isinstance(values, list):
+            values[:] = [pool.setdefault(value, value) for value in values]
+
+
+def _table_len(table):
+    """Number of rows in a column buffer."""
+    return len(next(iter(table.values()), ()))
+
+
+# (subject_id, subject_key, name, icon, color_hex, tailwind colour); the
+# Tailwind background/gradient/glow classes are derived from the colour name.
+SUBJECT_SPECS = [
+    ('phys-001', 'physics', 'Physics', 'Zap', '#3B82F6', 'blue'),
+    ('math-001', 'math', 'Mathematics', 'Calculator', '#10B981', 'emerald'),
+    ('chem-001', 'chemistry', 'Chemistry', 'FlaskConical', '#F59E0B', 'amber'),
+    ('bio-001', 'biology', 'Biology', 'Leaf', '#8B5CF6', 'violet'),
+]
+
 SAMPLE_DATA = {
-    'Subjects': [
-        {'subject_id': 'phys-001', 'subject_key': 'physics', 'name': 'Physics', 'icon': 'Zap', 
-         'color_hex': '#3B82F6', 'light_bg': 'bg-blue-50', 'gradient_from': 'blue-500', 
-         'gradient_to': 'blue-600', 'dark_glow': 'shadow-blue-500/20'},
-        {'subject_id': 'math-001', 'subject_key': 'math', 'name': 'Mathematics', 'icon': 'Calculator',
-         'color_hex': '#10B981', 'light_bg': 'bg-emerald-50', 'gradient_from': 'emerald-500',
-         'gradient_to': 'emerald-600', 'dark_glow': 'shadow-emerald-500/20'},
-        {'subject_id': 'chem-001', 'subject_key': 'chemistry', 'name': 'Chemistry', 'icon': 'FlaskConical',
-         'color_hex': '#F59E0B', 'light_bg': 'bg-amber-50', 'gradient_from': 'amber-500',
-         'gradient_to': 'amber-600', 'dark_glow': 'shadow-amber-500/20'},
-        {'subject_id': 'bio-001', 'subject_key': 'biology', 'name': 'Biology', 'icon': 'Leaf',
-         'color_hex': '#8B5CF6', 'light_bg': 'bg-violet-50', 'gradient_from': 'violet-500',
-         'gradient_to': 'violet-600', 'dark_glow': 'shadow-violet-500/20'},
-    ],
-    'Topics': [
+    'Subjects': _table_from_rows('Subjects', [
+        {'subject_id': sid, 'subject_key': key, 'name': name, 'icon': icon, 'color_hex': color_hex,
+         'light_bg': f'bg-{tw}-50', 'gradient_from': f'{tw}-500', 'gradient_to': f'{tw}-600',
+         'dark_glow': f'shadow-{tw}-500/20'}
+        for sid, key, name, icon, color_hex, tw in SUBJECT_SPECS
+    ]),
+    'Topics': _table_from_rows('Topics', [
         # PHYSICS
         {'topic_id': 'phys-t1', 'subject_key': 'physics', 'topic_name': "Newton's Laws", 'duration_minutes': 30, 'order_index': 1},
         {'topic_id': 'phys-t2', 'subject_key': 'physics', 'topic_name': 'Work & Energy', 'duration_minutes': 45, 'order_index': 2},
@@ -138,14 +288,14 @@ SAMPLE_DATA = {
         {'topic_id': 'bio-t1', 'subject_key': 'biology', 'topic_name': 'Cell Biology', 'duration_minutes': 30, 'order_index': 1},
         {'topic_id': 'bio-t2', 'subject_key': 'biology', 'topic_name': 'Genetics & DNA', 'duration_minutes': 40, 'order_index': 2},
         {'topic_id': 'bio-t3', 'subject_key': 'biology', 'topic_name': 'Ecosystems', 'duration_minutes': 35, 'order_index': 3},
-    ],
-    'Topic_Sections': [],
-    'Learning_Objectives': [],
-    'Key_Terms': [],
-    'Study_Content': [],
-    'Formulas': [],
-    'Quiz_Questions': [],
-    'Achievements': [
+    ]),
+    'Topic_Sections': _empty_table('Topic_Sections'),
+    'Learning_Objectives': _empty_table('Learning_Objectives'),
+    'Key_Terms': _empty_table('Key_Terms'),
+    'Study_Content': _empty_table('Study_Content'),
+    'Formulas': _empty_table('Formulas'),
+    'Quiz_Questions': _empty_table('Quiz_Questions'),
+    'Achievements': _table_from_rows('Achievements', [
         {'achievement_id': 'first-login', 'icon': 'Zap', 'name': 'First Login', 'description': 'Welcome to StudyHub!', 'unlock_condition': 'Login for the first time'},
         {'achievement_id': 'first-quiz', 'icon': 'HelpCircle', 'name': 'First Quiz', 'description': 'Complete your first quiz', 'unlock_condition': 'Complete any quiz'},
         {'achievement_id': 'streak-5', 'icon': 'Flame', 'name': '5-Day Streak', 'description': 'Study 5 days in a row', 'unlock_condition': 'streak >= 5'},
@@ -154,590 +304,831 @@ SAMPLE_DATA = {
         {'achievement_id': 'subject-50', 'icon': 'Trophy', 'name': 'Halfway There', 'description': '50% in any subject', 'unlock_condition': 'Any subject progress >= 50'},
         {'achievement_id': 'perfect-quiz', 'icon': 'Star', 'name': 'Perfect Score', 'description': 'Score 100% on a quiz', 'unlock_condition': 'Any quiz score = 100'},
         {'achievement_id': 'all-subjects', 'icon': 'Award', 'name': 'Well Rounded', 'description': 'Study all 4 subjects', 'unlock_condition': 'All subjects accessed'},
-    ]
+    ])
 }
 
-# Helper to add a topic's data
-def add_topic_data(topic_id, sections, objectives, terms, content, formulas, questions):
+# Sections are (title, icon, type) tuples; dicts with those keys (icon and type
+# optional) are still accepted. Key terms are (term, definition) tuples or
+# {'term', 'def'} dicts.
+#
+# Quiz questions are flat (text, a, b, c, d, ans, exp) tuples; dicts with those
+# keys are still accepted and converted on ingest.
+QUESTION_FIELDS = ('text', 'a', 'b', 'c', 'd', 'ans', 'exp')
+_question_fields = itemgetter(*QUESTION_FIELDS)
+
+# Content blocks are Content(sec_idx, type, title, text, ...) tuples; dicts
+# with the same keys (title, urls and order optional) are still accepted.
+Content = namedtuple('Content', ['sec_idx', 'type', 'title', 'text', 'image_url', 'video_url', 'order'],
+                     defaults=('', '', 1))
+
+# Formulas are Formula(text, label, variables) with up to three
+# Var(symbol, name, unit); legacy dicts with v1s/v1n/v1u... keys still work.
+Var = namedtuple('Var', ['symbol', 'name', 'unit'])
+Formula = namedtuple('Formula', ['text', 'label', 'variables'])
+BLANK_VAR = Var('', '', '')
+
+
+def _content_from_dict(c):
+    """Convert a {'sec_idx', 'type', 'text', ...} content dict to Content, ignoring unknown keys."""
+    return Content(c['sec_idx'], c['type'], c.get('title', ''), c['text'],
+                   c.get('image_url', ''), c.get('video_url', ''), c.get('order', 1))
+
+
+def _formula_from_dict(f):
+    """Convert a {'text', 'label', 'v1s', 'v1n', 'v1u', ...} formula dict to a Formula."""
+    return Formula(f['text'], f['label'],
+                   tuple(Var(f.get(f'v{n}s', ''), f.get(f'v{n}n', ''), f.get(f'v{n}u', '')) for n in (1, 2, 3)))
+
+
+def _topic_columns(topics, key):
+    """Split the items under key, across all topics, into parallel columns.
+
+    Returns (topic_ids, indexes, items): the owning topic, the item's 1-based
+    position within its topic, and the item itself.
+    """
+    topic_ids, indexes, items = [], [], []
+    for t in topics:
+        count = len(t[key])
+        topic_ids.extend([sys.intern(t['topic_id'])] * count)
+        indexes.extend(range(1, count+1))
+        items.extend(t[key])
+    return topic_ids, indexes, items
+
+
+def add_topic_data_bulk(topics):
+    """Append many topics' rows to SAMPLE_DATA, extending each column once per batch.
+
+    Each topic is a dict with topic_id, sections, objectives, terms, content,
+    formulas and questions (the add_topic_data arguments). The built-in sample
+    topics are filled in first, so added topics always follow them.
+    """
+    get_sample_data()
+    _add_topics(topics)
+
+
+def _add_topics(topics):
+    """Extend SAMPLE_DATA's per-topic sheets with topics' rows."""
+    batch = {}  # sheet -> {column: new values}
+
     # Add sections
-    for i, section in enumerate(sections, 1):
-        SAMPLE_DATA['Topic_Sections'].append({
-            'section_id': f"{topic_id}-s{i}",
-            'topic_id': topic_id,
-            'section_title': section['title'],
-            'section_icon': section.get('icon', 'FileText'),
-            'order_index': i,
-            'section_type': section.get('type', 'content')
-        })
+    batch['Topic_Sections'] = table = {}
+    tids, idxs, items = _topic_columns(topics, 'sections')
+    table['section_id'] = [f"{tid}-s{i}" for tid, i in zip(tids, idxs)]
+    table['topic_id'] = tids
+    rows = [s if isinstance(s, tuple) else (s['title'], s.get('icon', 'FileText'), s.get('type', 'content'))
+            for s in items]
+    titles, icons, types = zip(*rows) if rows else ((),) * 3
+    table['section_title'] = titles
+    table['section_icon'] = list(map(sys.intern, icons))
+    table['order_index'] = idxs
+    table['section_type'] = list(map(sys.intern, types))
 
     # Add objectives
-    for i, obj in enumerate(objectives, 1):
-        SAMPLE_DATA['Learning_Objectives'].append({
-            'objective_id': f"obj-{topic_id}-{i}",
-            'topic_id': topic_id,
-            'objective_text': obj,
-            'order_index': i
-        })
+    batch['Learning_Objectives'] = table = {}
+    tids, idxs, items = _topic_columns(topics, 'objectives')
+    table['objective_id'] = [f"obj-{tid}-{i}" for tid, i in zip(tids, idxs)]
+    table['topic_id'] = tids
+    table['objective_text'] = items
+    table['order_index'] = idxs
 
     # Add key terms
-    for i, term in enumerate(terms, 1):
-        SAMPLE_DATA['Key_Terms'].append({
-            'term_id': f"term-{topic_id}-{i}",
-            'topic_id': topic_id,
-            'term': term['term'],
-            'definition': term['def']
-        })
-
-    # Add content
-    for c in content:
-        SAMPLE_DATA['Study_Content'].append({
-            'content_id': f"cont-{topic_id}-{len(SAMPLE_DATA['Study_Content'])+1}",
-            'section_id': f"{topic_id}-s{c['sec_idx']}",
-            'content_type': c['type'],
-            'content_title': c.get('title', ''),
-            'content_text': c['text'],
-            'order_index': c.get('order', 1),
-            'image_url': c.get('image_url', ''),
-            'video_url': c.get('video_url', '')
-        })
+    batch['Key_Terms'] = table = {}
+    tids, idxs, items = _topic_columns(topics, 'terms')
+    table['term_id'] = [f"term-{tid}-{i}" for tid, i in zip(tids, idxs)]
+    table['topic_id'] = tids
+    rows = [t if isinstance(t, tuple) else (t['term'], t['def']) for t in items]
+    names, definitions = zip(*rows) if rows else ((),) * 2
+    table['term'] = names
+    table['definition'] = definitions
+
+    # Add content (content ids number rows across the whole sheet)
+    batch['Study_Content'] = table = {}
+    tids, idxs, items = _topic_columns(topics, 'content')
+    base = _table_len(SAMPLE_DATA['Study_Content'])
+    table['content_id'] = [f"cont-{tid}-{base+n}" for n, tid in enumerate(tids, 1)]
+    rows = [c if isinstance(c, tuple) else _content_from_dict(c) for c in items]
+    sec_idxs, types, titles, texts, image_urls, video_urls, orders = zip(*rows) if rows else ((),) * 7
+    table['section_id'] = [f"{tid}-s{sec_idx}" for tid, sec_idx in zip(tids, sec_idxs)]
+    table['content_type'] = list(map(sys.intern, types))
+    table['content_title'] = titles
+    table['content_text'] = texts
+    table['order_index'] = _int_values(orders, 'Study_Content', 'order_index')
+    table['image_url'] = image_urls
+    table['video_url'] = video_urls
 
     # Add formulas
-    for i, f in enumerate(formulas, 1):
-        SAMPLE_DATA['Formulas'].append({
-            'formula_id': f"form-{topic_id}-{i}",
-            'topic_id': topic_id,
-            'formula_text': f['text'],
-            'formula_label': f['label'],
-            'variable_1_symbol': f.get('v1s', ''), 'variable_1_name': f.get('v1n', ''), 'variable_1_unit': f.get('v1u', ''),
-            'variable_2_symbol': f.get('v2s', ''), 'variable_2_name': f.get('v2n', ''), 'variable_2_unit': f.get('v2u', ''),
-            'variable_3_symbol': f.get('v3s', ''), 'variable_3_name': f.get('v3n', ''), 'variable_3_unit': f.get('v3u', ''),
-        })
+    batch['Formulas'] = table = {}
+    tids, idxs, items = _topic_columns(topics, 'formulas')
+    table['formula_id'] = [f"form-{tid}-{i}" for tid, i in zip(tids, idxs)]
+    table['topic_id'] = tids
+    rows = [f if isinstance(f, tuple) else _formula_from_dict(f) for f in items]
+    for f in rows:
+        if len(f.variables) > 3:
+            raise ValueError(f"Formula '{f.label}' has {len(f.variables)} variables; "
+                             "the Formulas sheet holds at most 3")
+    table['formula_text'] = [f.text for f in rows]
+    table['formula_label'] = [f.label for f in rows]
+    for n in (1, 2, 3):
+        variables = [f.variables[n-1] if len(f.variables) >= n else BLANK_VAR for f in rows]
+        table[f'variable_{n}_symbol'] = [v.symbol for v in variables]
+        table[f'variable_{n}_name'] = [v.name for v in variables]
+        table[f'variable_{n}_unit'] = [sys.intern(v.unit) for v in variables]
 
     # Add quizzes
-    for i, q in enumerate(questions, 1):
-        SAMPLE_DATA['Quiz_Questions'].append({
-            'question_id': f"quiz-{topic_id}-{i}",
-            'topic_id': topic_id,
-            'question_text': q['text'],
-            'option_a': q['a'], 'option_b': q['b'], 'option_c': q['c'], 'option_d': q['d'],
-            'correct_answer': q['ans'],
-            'explanation': q['exp'],
-            'xp_reward': 10
-        })
+    batch['Quiz_Questions'] = table = {}
+    tids, idxs, items = _topic_columns(topics, 'questions')
+    table['question_id'] = [f"quiz-{tid}-{i}" for tid, i in zip(tids, idxs)]
+    table['topic_id'] = tids
+    rows = [q if isinstance(q, tuple) else _question_fields(q) for q in items]
+    texts, opt_a, opt_b, opt_c, opt_d, answers, explanations = zip(*rows) if rows else ((),) * 7
+    table['question_text'] = texts
+    table['option_a'] = opt_a
+    table['option_b'] = opt_b
+    table['option_c'] = opt_c
+    table['option_d'] = opt_d
+    table['correct_answer'] = list(map(sys.intern, answers))
+    table['explanation'] = explanations
+    table['xp_reward'] = [10] * len(items)
+
+    # Every sheet's new columns are built (and checked) before any is extended,
+    # so a bad item leaves SAMPLE_DATA unchanged
+    for sheet_name, columns in batch.items():
+        table = SAMPLE_DATA[sheet_name]
+        for col, values in columns.items():
+            table[col].extend(values)
+
+
+# Helper to add a topic's data
+def add_topic_data(topic_id, sections, objectives, terms, content, formulas, questions):
+    """Append one topic's rows to SAMPLE_DATA."""
+    add_topic_data_bulk([{'topic_id': topic_id, 'sections': sections, 'objectives': objectives,
+                          'terms': terms, 'content': content, 'formulas': formulas, 'questions': questions}])
 
 # ==========================================
 # POPULATE DETAILED CONTENT
 # ==========================================
 
-# 1. PHYSICS - Newton's Laws
-add_topic_data('phys-t1',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Introduction', 'icon': 'BookOpen', 'type': 'intro'},
-        {'title': 'First Law (Inertia)', 'icon': 'Zap', 'type': 'content'},
-        {'title': 'Second Law (F=ma)', 'icon': 'Calculator', 'type': 'content'},
-        {'title': 'Third Law (Action-Reaction)', 'icon': 'Zap', 'type': 'content'},
-        {'title': 'Assessment', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Define inertia and its relationship to mass', 'Apply F=ma to solve problems', 'Identify action-reaction pairs', 'Understand the concept of net force', 'Distinguish between mass and weight'],
-    terms=[
-        {'term': 'Inertia', 'def': 'Resistance of any physical object to any change in its velocity'},
-        {'term': 'Force', 'def': 'A push or pull upon an object resulting from interaction with another object'},
-        {'term': 'Mass', 'def': 'A measure of the amount of matter in an object'},
-        {'term': 'Net Force', 'def': 'The vector sum of all forces acting on an object'},
-        {'term': 'Acceleration', 'def': 'The rate of change of velocity per unit of time'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'The Foundations of Dynamics', 'text': "Isaac Newton's three laws of motion describe the relationship between the motion of an object and the forces acting on it.", 'image_url': 'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=800'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Law of Inertia', 'text': 'An object at rest stays at rest and an object in motion stays in motion unless acted upon by an unbalanced force.'},
-        {'sec_idx': 3, 'type': 'real_world', 'title': 'Seatbelts', 'text': 'When a car stops suddenly, your body keeps moving forward due to inertia. Seatbelts provide the unbalanced force to stop you.'},
-        {'sec_idx': 3, 'type': 'warning', 'title': 'Inertia is NOT a force', 'text': 'Inertia is a property of matter, not a force that pushes you.'},
-        {'sec_idx': 4, 'type': 'formula', 'title': 'The Equation', 'text': 'F = ma'},
-        {'sec_idx': 4, 'type': 'text', 'title': 'Explanation', 'text': 'Force equals mass times acceleration. The more mass an object has, the more force is needed to accelerate it.'},
-         {'sec_idx': 4, 'type': 'concept_helper', 'title': 'Proportionality', 'text': 'Acceleration is directly proportional to Force and inversely proportional to Mass.'},
-        {'sec_idx': 5, 'type': 'text', 'title': 'Symmetry in Forces', 'text': 'For every action, there is an equal and opposite reaction. Forces always come in pairs.'},
-        {'sec_idx': 5, 'type': 'warning', 'title': 'Common Mistake', 'text': 'Action and reaction forces act on DIFFERENT objects, so they do not cancel each other out!'},
-        {'sec_idx': 5, 'type': 'real_world', 'title': 'Rocket Propulsion', 'text': 'A rocket pushes gas down (action), and the gas pushes the rocket up (reaction).'}
-    ],
-    formulas=[
-        {'text': 'F = m \\cdot a', 'label': "Newton's Second Law", 'v1s': 'F', 'v1n': 'Force', 'v1u': 'N', 'v2s': 'm', 'v2n': 'Mass', 'v2u': 'kg', 'v3s': 'a', 'v3n': 'Acceleration', 'v3u': 'm/s²'},
-        {'text': 'W = m \\cdot g', 'label': "Weight", 'v1s': 'W', 'v1n': 'Weight', 'v1u': 'N', 'v2s': 'm', 'v2n': 'Mass', 'v2u': 'kg', 'v3s': 'g', 'v3n': 'Gravity', 'v3u': 'm/s²'}
-    ],
-    questions=[
-        {'text': 'Which property of an object determines its inertia?', 'a': 'Volume', 'b': 'Mass', 'c': 'Weight', 'd': 'Velocity', 'ans': 'B', 'exp': 'Mass is a direct measure of inertia.'},
-        {'text': 'If you double the force on an object, what happens to its acceleration?', 'a': 'Doubles', 'b': 'Halves', 'c': 'Quadruples', 'd': 'Stays same', 'ans': 'A', 'exp': 'Acceleration is directly proportional to force (F=ma).'},
-        {'text': 'A 10kg object accelerates at 2 m/s². What is the force?', 'a': '5 N', 'b': '12 N', 'c': '20 N', 'd': '0.2 N', 'ans': 'C', 'exp': 'F = m * a = 10 * 2 = 20 N.'},
-        {'text': 'Which law explains why a book sits still on a table?', 'a': '1st Law', 'b': '2nd Law', 'c': '3rd Law', 'd': 'Gravitational Law', 'ans': 'A', 'exp': '1st Law: Objects at rest stay at rest unless acted on by unbalanced force.'},
-        {'text': 'Action and reaction forces are always...', 'a': 'Unequal', 'b': 'In the same direction', 'c': 'Acting on the same object', 'd': 'Equal and opposite', 'ans': 'D', 'exp': 'Newton\'s 3rd Law states they are equal in magnitude and opposite in direction.'}
-    ]
-)
-
-# 2. PHYSICS - Work & Energy
-add_topic_data('phys-t2',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Work', 'icon': 'Hammer', 'type': 'content'},
-        {'title': 'Energy Types', 'icon': 'Zap', 'type': 'content'},
-        {'title': 'Conservation', 'icon': 'RefreshCw', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Define Work in physics', 'Distinguish between kinetic and potential energy', 'Apply conservation of energy principle', 'Calculate work and power', 'Understand mechanical advantage'],
-    terms=[
-        {'term': 'Work', 'def': 'Force applied over a distance (Joules)'},
-        {'term': 'Kinetic Energy', 'def': 'Energy of motion'},
-        {'term': 'Potential Energy', 'def': 'Stored energy due to position or state'},
-        {'term': 'Power', 'def': 'The rate at which work is done (Watts)'},
-        {'term': 'Mechanical Energy', 'def': 'Sum of potential and kinetic energy'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Physics Definition of Work', 'text': 'In physics, work is done only when a force moves an object. Pushing a wall and not moving it means zero work is done!', 'image_url': 'https://images.unsplash.com/photo-1516937941348-c096b542b9c9?w=800'},
-        {'sec_idx': 2, 'type': 'formula', 'title': 'Work Formula', 'text': 'W = F \\cdot d'},
-        {'sec_idx': 2, 'type': 'concept_helper', 'title': 'Direction Matters', 'text': 'The force must be in the same direction as the movement for maximum work.'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Kinetic vs Potential', 'text': 'A roller coaster at the top has high Potential Energy. As it falls, it converts to Kinetic Energy.'},
-        {'sec_idx': 3, 'type': 'video', 'title': 'Roller Coaster Physics', 'text': 'Watch how energy transforms.', 'video_url': 'https://www.youtube.com/watch?v=Jnj8mc04r9E'},
-        {'sec_idx': 4, 'type': 'concept_helper', 'title': 'Law of Conservation', 'text': 'Energy cannot be created or destroyed, only transformed.'},
-        {'sec_idx': 4, 'type': 'flowchart', 'title': 'Energy Transformation', 'text': 'Visualizing how Potential Energy converts to Kinetic Energy.', 'image_url': 'https://mermaid.ink/img/pako:eNpVkMtqwzAQRX9FzKqF_IAeCqWbQsFQAqG7tciyxBZiS0ZSCyX_Xsdf4tJldTPn3DszGtToFCpoeD3pW_QeXwZ0h8-z_sQ12p05sB_tQ4B794dY6_tHj9F59GfW_4E-sB-sO9Z_sBfsC_vAPrAf7IA11v2wF-wL-8A-sB_s4J-x0k5bCg0ZylJyoOQYpZJMy5qrpRCSk0pWUp5S8oOQnJSkC_lLyU_2z7-Xw6GgUCqVbLhQ0pCpkHJYl0qJ4uO6Ff_2B2HqSgM?type=png'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Pendulums', 'text': 'A swinging pendulum constantly swaps PE and KE. It stops eventually only because of air resistance (friction).'}
-    ],
-    formulas=[
-        {'text': 'W = F \\cdot d', 'label': 'Work', 'v1s': 'W', 'v1n': 'Work', 'v1u': 'J', 'v2s': 'F', 'v2n': 'Force', 'v2u': 'N', 'v3s': 'd', 'v3n': 'Distance', 'v3u': 'm'},
-        {'text': 'KE = \\frac{1}{2}mv^2', 'label': 'Kinetic Energy', 'v1s': 'KE', 'v1n': 'Energy', 'v1u': 'J', 'v2s': 'm', 'v2n': 'Mass', 'v2u': 'kg', 'v3s': 'v', 'v3n': 'Velocity', 'v3u': 'm/s'},
-        {'text': 'PE_g = mgh', 'label': 'Gravitational Potential Energy', 'v1s': 'PE', 'v1n': 'Potential Energy', 'v1u': 'J', 'v2s': 'm', 'v2n': 'Mass', 'v2u': 'kg', 'v3s': 'h', 'v3n': 'Height', 'v3u': 'm'}
-    ],
-    questions=[
-        {'text': 'What is the unit for Work?', 'a': 'Newton', 'b': 'Watt', 'c': 'Joule', 'd': 'Meter', 'ans': 'C', 'exp': 'Work is measured in Joules (N·m).'},
-        {'text': 'A ball held 2m high has what type of energy?', 'a': 'Kinetic', 'b': 'Gravitational Potential', 'c': 'Elastic', 'd': 'Thermal', 'ans': 'B', 'exp': 'It has potential due to gravity.'},
-        {'text': 'If you lift a 5kg box 2 meters, how much work did you do? (g=10)', 'a': '10 J', 'b': '50 J', 'c': '100 J', 'd': '7 J', 'ans': 'C', 'exp': 'W = Fd = mgd = 5 * 10 * 2 = 100 J.'},
-        {'text': 'Energy of motion is called...', 'a': 'Potential', 'b': 'Kinetic', 'c': 'Thermal', 'd': 'Chemical', 'ans': 'B', 'exp': 'Kinetic comes from the Greek word "kinesis" (motion).'},
-        {'text': 'Can energy be destroyed?', 'a': 'Yes, by friction', 'b': 'Yes, in black holes', 'c': 'No, only transformed', 'd': 'No, except nuclear', 'ans': 'C', 'exp': 'Law of Conservation of Energy states it cannot be created or destroyed.'}
-    ]
-)
-
-# 3. PHYSICS - Electricity
-add_topic_data('phys-t3',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Circuits', 'icon': 'Zap', 'type': 'content'},
-        {'title': "Ohm's Law", 'icon': 'Calculator', 'type': 'content'},
-        {'title': 'Power & Safety', 'icon': 'AlertTriangle', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Understand circuit components', "Calculate using Ohm's Law", 'Differentiate series and parallel circuits', 'Calculate electrical power', 'Identify electrical safety hazards'],
-    terms=[
-        {'term': 'Voltage', 'def': 'Electrical potential difference (Volts)'},
-        {'term': 'Current', 'def': 'Flow of electric charge (Amps)'},
-        {'term': 'Resistance', 'def': 'Opposition to current flow (Ohms)'},
-        {'term': 'Series Circuit', 'def': 'A circuit with only one path for current'},
-        {'term': 'Parallel Circuit', 'def': 'A circuit with multiple paths for current'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Electric Circuits', 'text': 'A closed loop that allows current to flow. Requires a source (battery), load (bulb), and wires.', 'image_url': 'https://images.unsplash.com/photo-1549419163-e380e22784cb?w=800'},
-        {'sec_idx': 2, 'type': 'concept_helper', 'title': 'Series vs Parallel', 'text': 'In Series, if one bulb goes out, they all go out. In Parallel, others stay on.'},
-        {'sec_idx': 3, 'type': 'formula', 'title': "Ohm's Law", 'text': 'V = I \\cdot R'},
-        {'sec_idx': 3, 'type': 'real_world', 'title': 'Resistors', 'text': 'Electronics use resistors to control current so delicate components don\'t burn out.'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Analogy', 'text': 'Voltage is like water pressure, Current is like water flow, Resistance is like a narrow pipe.'},
-        {'sec_idx': 4, 'type': 'formula', 'title': 'Electrical Power', 'text': 'P = I \\cdot V'},
-        {'sec_idx': 4, 'type': 'warning', 'title': 'Short Circuits', 'text': 'Never connect positive directly to negative without a load! It creates dangerous heat.'}
-    ],
-    formulas=[
-        {'text': 'V = I \\cdot R', 'label': "Ohm's Law", 'v1s': 'V', 'v1n': 'Voltage', 'v1u': 'V', 'v2s': 'I', 'v2n': 'Current', 'v2u': 'A', 'v3s': 'R', 'v3n': 'Resistance', 'v3u': 'Ω'},
-        {'text': 'P = I \\cdot V', 'label': "Electrical Power", 'v1s': 'P', 'v1n': 'Power', 'v1u': 'W', 'v2s': 'I', 'v2n': 'Current', 'v2u': 'A', 'v3s': 'V', 'v3n': 'Voltage', 'v3u': 'V'}
-    ],
-    questions=[
-        {'text': 'What flows in a circuit?', 'a': 'Protons', 'b': 'Neutrons', 'c': 'Electrons', 'd': 'Atoms', 'ans': 'C', 'exp': 'Current is the flow of electrons.'},
-        {'text': 'In which circuit type do all lights go out if one breaks?', 'a': 'Parallel', 'b': 'Series', 'c': 'Open', 'd': 'Short', 'ans': 'B', 'exp': 'Series circuits have only one path.'},
-        {'text': 'If V=12V and R=4Ω, what is the Current?', 'a': '3 A', 'b': '48 A', 'c': '0.33 A', 'd': '16 A', 'ans': 'A', 'exp': 'I = V/R = 12/4 = 3 Amps.'},
-        {'text': 'What unit measures Resistance?', 'a': 'Volt', 'b': 'Amp', 'c': 'Ohm', 'd': 'Watt', 'ans': 'C', 'exp': 'Ohms (Ω) measure resistance.'},
-        {'text': 'What happens to current if resistance increases (Voltage constant)?', 'a': 'Increases', 'b': 'Decreases', 'c': 'Stays same', 'd': 'Becomes zero', 'ans': 'B', 'exp': 'Current and Resistance are inversely proportional.'}
-    ]
-)
-
-# 4. MATH - Algebraic Expressions
-add_topic_data('math-t1',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Basics', 'icon': 'BookOpen', 'type': 'content'},
-        {'title': 'Simplifying', 'icon': 'Minimize2', 'type': 'content'},
-        {'title': 'Expanding & Factoring', 'icon': 'Maximize2', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Identify variables and coefficients', 'Simplify like terms', 'Expand algebraic expressions using distributive property', 'Factor simple expressions', 'Evaluate expressions'],
-    terms=[
-        {'term': 'Variable', 'def': 'A letter representing an unknown number'},
-        {'term': 'Coefficient', 'def': 'Number multiplying a variable'},
-        {'term': 'Constant', 'def': 'A fixed value that does not change'},
-        {'term': 'Like Terms', 'def': 'Terms that have identical variable parts'},
-        {'term': 'Distributive Property', 'def': 'a(b + c) = ab + ac'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'text', 'title': 'What is Algebra?', 'text': 'Algebra is generalized arithmetic. We use letters to represent numbers we don\'t know yet.'},
-        {'sec_idx': 2, 'type': 'image', 'title': 'Parts of an Expression', 'text': 'Visual breakdown of 3x + 5', 'image_url': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Algebraic_term.svg/320px-Algebraic_term.svg.png'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Like Terms', 'text': 'You can only add terms if they have the same variable part. 2x + 3x = 5x, but 2x + 3y cannot be combined.'},
-        {'sec_idx': 3, 'type': 'warning', 'title': 'Watch the powers', 'text': 'x and x² are NOT like terms!'},
-        {'sec_idx': 4, 'type': 'formula', 'title': 'Distributive Property', 'text': 'a(b + c) = ab + ac'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Budgeting', 'text': 'If you buy 3 shirts for $x each and 2 pants for $y each, total cost is 3x + 2y.'},
-        {'sec_idx': 4, 'type': 'text', 'title': 'Factoring', 'text': 'Factoring is the reverse of expanding. 2x + 4 = 2(x + 2).'}
-    ],
-    formulas=[
-         {'text': 'a(b + c) = ab + ac', 'label': 'Distributive Property', 'v1s': 'a', 'v1n': 'Factor', 'v1u': '', 'v2s': 'b', 'v2n': 'Term 1', 'v2u': '', 'v3s': 'c', 'v3n': 'Term 2', 'v3u': ''}
-    ],
-    questions=[
-        {'text': 'Simplify: 3x + 4y - x', 'a': '7xy', 'b': '2x + 4y', 'c': '6xy', 'd': '3x + 3y', 'ans': 'B', 'exp': 'Combine 3x and -x to get 2x. 4y stays separate.'},
-        {'text': 'Expand: 2(x + 3)', 'a': '2x + 3', 'b': '2x + 6', 'c': 'x + 6', 'd': '5x', 'ans': 'B', 'exp': 'Multiply 2 by both terms inside: 2*x + 2*3.'},
-        {'text': 'What is the coefficient in 5y?', 'a': 'y', 'b': '5', 'c': '5y', 'd': 'Unknown', 'ans': 'B', 'exp': 'The number multiplying the variable is the coefficient.'},
-        {'text': 'Are 3x and 3x² like terms?', 'a': 'Yes', 'b': 'No', 'c': 'Sometimes', 'd': 'Only if x=1', 'ans': 'B', 'exp': 'No, because the exponents are different.'},
-        {'text': 'Evaluate 2x + 1 when x = 4', 'a': '6', 'b': '7', 'c': '9', 'd': '8', 'ans': 'C', 'exp': '2(4) + 1 = 8 + 1 = 9.'}
-    ]
-)
-
-# 5. MATH - Geometry: Triangles
-add_topic_data('math-t2',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Types', 'icon': 'Triangle', 'type': 'content'},
-        {'title': 'Pythagoras', 'icon': 'Calculator', 'type': 'content'},
-        {'title': 'Area & Perimeter', 'icon': 'Grid', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Classify triangles by sides and angles', 'Use Pythagorean theorem', 'Calculate area of triangles', 'Identify triangle properties', 'Solve real-world problems involving triangles'],
-    terms=[
-        {'term': 'Hypotenuse', 'def': 'Longest side of a right triangle'},
-        {'term': 'Isosceles', 'def': 'Triangle with 2 equal sides'},
-        {'term': 'Equilateral', 'def': 'Triangle with 3 equal sides'},
-        {'term': 'Scalene', 'def': 'Triangle with no equal sides'},
-        {'term': 'Right Angle', 'def': '90 degree angle'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Triangle Types', 'text': 'Triangles can be classified by sides (equilateral, isosceles, scalene) or angles (acute, obtuse, right).', 'image_url': 'https://images.unsplash.com/photo-1616469829941-c7200ed5dabd?w=800'},
-        {'sec_idx': 2, 'type': 'concept_helper', 'title': 'Angle Sum', 'text': 'The sum of angles in ANY triangle is always 180°.'},
-        {'sec_idx': 3, 'type': 'formula', 'title': 'Pythagorean Theorem', 'text': 'a^2 + b^2 = c^2'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Usage', 'text': 'Used to find a missing side in a right-angled triangle. c is always the hypotenuse.'},
-        {'sec_idx': 4, 'type': 'formula', 'title': 'Area of Triangle', 'text': 'A = \\frac{1}{2}bh'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Construction', 'text': 'Builders use the 3-4-5 rule (Pythagoras) to check if corners are perfectly square.'},
-        {'sec_idx': 4, 'type': 'warning', 'title': 'Height must be perpendicular', 'text': 'When calculating area, the height must be at a 90° angle to the base.'}
-    ],
-    formulas=[
-        {'text': 'a^2 + b^2 = c^2', 'label': 'Pythagorean Theorem', 'v1s': 'c', 'v1n': 'Hypotenuse', 'v1u': '', 'v2s': 'a', 'v2n': 'Side A', 'v2u': '', 'v3s': 'b', 'v3n': 'Side B', 'v3u': ''},
-        {'text': 'A = \\frac{1}{2}b \\cdot h', 'label': 'Area of Triangle', 'v1s': 'A', 'v1n': 'Area', 'v1u': 'units²', 'v2s': 'b', 'v2n': 'Base', 'v2u': 'units', 'v3s': 'h', 'v3n': 'Height', 'v3u': 'units'}
-    ],
-    questions=[
-        {'text': 'Which triangle has all equal sides?', 'a': 'Isosceles', 'b': 'Scalene', 'c': 'Equilateral', 'd': 'Right', 'ans': 'C', 'exp': 'Equi-lateral means equal sides.'},
-        {'text': 'Calculate the hypotenuse if sides are 3 and 4.', 'a': '5', 'b': '6', 'c': '7', 'd': '25', 'ans': 'A', 'exp': '3² + 4² = 9 + 16 = 25. √25 = 5.'},
-        {'text': 'Sum of angles in a triangle?', 'a': '90', 'b': '180', 'c': '360', 'd': '100', 'ans': 'B', 'exp': 'Always 180 degrees.'},
-        {'text': 'Area of a triangle with base 10 and height 5?', 'a': '50', 'b': '25', 'c': '15', 'd': '100', 'ans': 'B', 'exp': '0.5 * 10 * 5 = 25.'},
-        {'text': 'A triangle with angles 90, 45, 45 is...', 'a': 'Obtuse', 'b': 'Acute', 'c': 'Right Isosceles', 'd': 'Equilateral', 'ans': 'C', 'exp': 'Right (has 90°) and Isosceles (two equal angles/sides).'}
-    ]
-)
-
-# 6. MATH - Probability
-add_topic_data('math-t3',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Chance', 'icon': 'HelpCircle', 'type': 'content'},
-        {'title': 'Calculating', 'icon': 'Calculator', 'type': 'content'},
-        {'title': 'Multiple Events', 'icon': 'GitBranch', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Understand probability scale', 'Calculate simple probabilities', 'Determine sample spaces', 'Calculate probability of multiple events', 'Understand complementary events'],
-    terms=[
-        {'term': 'Event', 'def': 'An outcome or set of outcomes'},
-        {'term': 'Sample Space', 'def': 'Set of all possible outcomes'},
-        {'term': 'Impossible', 'def': 'Probability of 0'},
-        {'term': 'Certain', 'def': 'Probability of 1 (or 100%)'},
-        {'term': 'Independent Events', 'def': 'Events where one outcome does not affect the other'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'text', 'title': 'The Scale', 'text': 'Probability ranges from 0 (Impossible) to 1 (Certain). Fractions, decimals, or percentages can be used.'},
-        {'sec_idx': 2, 'type': 'image', 'title': 'Probability Scale', 'text': '0 ----- 0.5 ----- 1', 'image_url': 'https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Probability_Scale_Line.svg/640px-Probability_Scale_Line.svg.png'},
-        {'sec_idx': 3, 'type': 'formula', 'title': 'Basic Probability', 'text': 'P(A) = \\frac{\\text{favorable outcomes}}{\\text{total outcomes}}'},
-        {'sec_idx': 3, 'type': 'real_world', 'title': 'Dice', 'text': 'Rolling a 6 on a standard die has a 1/6 chance.', 'image_url': 'https://images.unsplash.com/photo-1595113316349-9fa4eb24f884?w=800'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Complementary Events', 'text': 'P(Not A) = 1 - P(A). Chance of rain is 20%, chance of NO rain is 80%.'},
-        {'sec_idx': 4, 'type': 'text', 'title': 'Multiple Events', 'text': 'For independent events (like flipping two coins), multiply the probabilities.'},
-        {'sec_idx': 4, 'type': 'warning', 'title': 'Gambler\'s Fallacy', 'text': 'Past results do not affect independent future results. The coin doesn\'t "remember" it was heads.'}
-    ],
-    formulas=[
-        {'text': 'P(A) = \\frac{n(A)}{n(S)}', 'label': 'Probability', 'v1s': 'P', 'v1n': 'Probability', 'v1u': '', 'v2s': 'n(A)', 'v2n': 'Favorable', 'v2u': '', 'v3s': 'n(S)', 'v3n': 'Total', 'v3u': ''},
-        {'text': 'P(A \\cap B) = P(A) \\times P(B)', 'label': 'Independent Events', 'v1s': 'P', 'v1n': 'Probability', 'v1u': '', 'v2s': 'A', 'v2n': 'Event A', 'v2u': '', 'v3s': 'B', 'v3n': 'Event B', 'v3u': ''}
-    ],
-    questions=[
-        {'text': 'Probability of flipping heads?', 'a': '0.25', 'b': '0.5', 'c': '0.75', 'd': '1.0', 'ans': 'B', 'exp': '1 favorable (heads) / 2 total (heads, tails) = 0.5'},
-        {'text': 'Probability of rolling a 7 on a standard die?', 'a': '1/6', 'b': '1/2', 'c': '0', 'd': '1', 'ans': 'C', 'exp': 'Impossible. Die only goes to 6.'},
-        {'text': 'If P(Win) = 0.4, what is P(Lose)?', 'a': '0.4', 'b': '0.6', 'c': '0.5', 'd': '0.1', 'ans': 'B', 'exp': '1 - 0.4 = 0.6'},
-        {'text': 'Probability of flipping heads TWICE in a row?', 'a': '0.5', 'b': '0.25', 'c': '0.1', 'd': '0.75', 'ans': 'B', 'exp': '0.5 * 0.5 = 0.25'},
-        {'text': 'The set of all possible outcomes is called...', 'a': 'Event', 'b': 'Probability', 'c': 'Sample Space', 'd': 'Result', 'ans': 'C', 'exp': 'Definition of Sample Space.'}
-    ]
-)
-
-# 7. CHEMISTRY - Atomic Structure
-add_topic_data('chem-t1',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'The Atom', 'icon': 'Atom', 'type': 'content'},
-        {'title': 'Subatomic Particles', 'icon': 'Disc', 'type': 'content'},
-        {'title': 'Isotopes', 'icon': 'Copy', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Describe the structure of an atom', 'Identify protons, neutrons, electrons', 'Determine atomic mass and atomic number', 'Understand isotopes', 'Draw simple atomic models'],
-    terms=[
-        {'term': 'Nucleus', 'def': 'Central part of atom containing protons/neutrons'},
-        {'term': 'Electron Shell', 'def': 'Region where electrons orbit'},
-        {'term': 'Atomic Number', 'def': 'Number of protons (defines the element)'},
-        {'term': 'Mass Number', 'def': 'Protons + Neutrons'},
-        {'term': 'Isotope', 'def': 'Same element with different number of neutrons'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Building Blocks', 'text': 'All matter is made of atoms. They are the smallest unit of an element.', 'image_url': 'https://images.unsplash.com/photo-1614730341194-75c60740a070?w=800'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Inside the Atom', 'text': 'Protons (+ charge) and Neutrons (no charge) are in the center. Electrons (- charge) zoom around the outside.'},
-        {'sec_idx': 3, 'type': 'video', 'title': 'Atomic Model', 'text': 'Visualizing the atom.', 'video_url': 'https://www.youtube.com/watch?v=IO9WS_HNmyg'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Empty Space', 'text': 'Atoms are mostly empty space. If the nucleus was a marble, the atom would be a stadium!'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Carbon Dating', 'text': 'We use Carbon-14 (an isotope) to figure out how old ancient fossils are.'},
-        {'sec_idx': 4, 'type': 'image', 'title': 'Bohr Model', 'text': 'Simplified view of electron shells', 'image_url': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Bohr-atom-PAR.svg/320px-Bohr-atom-PAR.svg.png'}
-    ],
-    formulas=[
-        {'text': 'A = Z + N', 'label': 'Mass Number', 'v1s': 'A', 'v1n': 'Mass No', 'v1u': '', 'v2s': 'Z', 'v2n': 'Protons', 'v2u': '', 'v3s': 'N', 'v3n': 'Neutrons', 'v3u': ''}
-    ],
-    questions=[
-        {'text': 'Which particle has a positive charge?', 'a': 'Electron', 'b': 'Neutron', 'c': 'Proton', 'd': 'Photon', 'ans': 'C', 'exp': 'Protons are positive (+)'},
-        {'text': 'Where are electrons found?', 'a': 'Nucleus', 'b': 'Shells', 'c': 'Inside protons', 'd': 'Everywhere', 'ans': 'B', 'exp': 'Electrons orbit in shells/clouds around the nucleus.'},
-        {'text': 'Atomic number tells you the number of...', 'a': 'Neutrons', 'b': 'Electrons', 'c': 'Protons', 'd': 'Isotopes', 'ans': 'C', 'exp': 'Atomic number = number of protons.'},
-        {'text': 'Isotopes have different numbers of...', 'a': 'Protons', 'b': 'Neutrons', 'c': 'Electrons', 'd': 'Shells', 'ans': 'B', 'exp': 'Isotopes are same element (same protons) but different mass (neutrons).'},
-        {'text': 'Most of an atom is...', 'a': 'Solid', 'b': 'Liquid', 'c': 'Empty space', 'd': 'Gas', 'ans': 'C', 'exp': 'The nucleus is tiny compared to the electron cloud volume.'}
-    ]
-)
-
-# 8. CHEMISTRY - Periodic Table
-add_topic_data('chem-t2',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Organization', 'icon': 'Grid', 'type': 'content'},
-        {'title': 'Groups & Periods', 'icon': 'ArrowDown', 'type': 'content'},
-        {'title': 'Metals vs Non-Metals', 'icon': 'Layers', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Read the Periodic Table', 'Understand Groups and Periods', 'Predict properties based on location', 'Identify metals, non-metals, and metalloids', 'Know common element families'],
-    terms=[
-        {'term': 'Group', 'def': 'Vertical column (similar properties)'},
-        {'term': 'Period', 'def': 'Horizontal row (electron shells)'},
-        {'term': 'Alkali Metals', 'def': 'Group 1 elements (highly reactive)'},
-        {'term': 'Noble Gases', 'def': 'Group 18 elements (unreactive)'},
-        {'term': 'Halogens', 'def': 'Group 17 elements (reactive non-metals)'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'The Map of Elements', 'text': 'The periodic table organizes all known elements by atomic number and chemical properties.', 'image_url': 'https://images.unsplash.com/photo-1603126857599-f6e157fa2fe6?w=800'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Navigation', 'text': 'Columns are called Groups (elements behave similarly). Rows are called Periods.'},
-        {'sec_idx': 3, 'type': 'real_world', 'title': 'Noble Gases', 'text': 'Group 18 elements are "Noble Gases" - they are very stable and don\'t like to react (like Neon signs).'},
-        {'sec_idx': 4, 'type': 'text', 'title': 'Metals vs Non-Metals', 'text': 'Metals are on the left (shiny, conduct), Non-metals on the right (dull, insulate). Staircase line separates them.'},
-        {'sec_idx': 4, 'type': 'warning', 'title': 'Hydrogen Exception', 'text': 'Hydrogen is in Group 1 but it is a NON-METAL gas, not a metal.'},
-        {'sec_idx': 4, 'type': 'image', 'title': 'Periodic Table Sections', 'text': 'Color coded regions', 'image_url': 'https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Periodic_Table_Structure.svg/640px-Periodic_Table_Structure.svg.png'}
-    ],
-    formulas=[],
-    questions=[
-        {'text': 'Elements in the same column usually have...', 'a': 'Same mass', 'b': 'Similar properties', 'c': 'Same atomic number', 'd': 'Different states', 'ans': 'B', 'exp': 'Groups (columns) share chemical properties.'},
-        {'text': 'Which group contains the Noble Gases?', 'a': '1', 'b': '2', 'c': '17', 'd': '18', 'ans': 'D', 'exp': 'Group 18 (far right) are Noble Gases.'},
-        {'text': 'Where are metals found on the table?', 'a': 'Left', 'b': 'Right', 'c': 'Top only', 'd': 'Bottom only', 'ans': 'A', 'exp': 'Metals make up the majority of the left side.'},
-        {'text': 'Horizontal rows are called...', 'a': 'Groups', 'b': 'Families', 'c': 'Periods', 'd': 'Sections', 'ans': 'C', 'exp': 'Periods go across.'},
-        {'text': 'Which element is a non-metal in Group 1?', 'a': 'Lithium', 'b': 'Sodium', 'c': 'Hydrogen', 'd': 'Potassium', 'ans': 'C', 'exp': 'Hydrogen is the exception.'}
-    ]
-)
-
-# 9. CHEMISTRY - Bonding
-add_topic_data('chem-t3',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Why Bond?', 'icon': 'Link', 'type': 'content'},
-        {'title': 'Ionic Bonding', 'icon': 'Zap', 'type': 'content'},
-        {'title': 'Covalent Bonding', 'icon': 'GitCommit', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Explain why atoms bond', 'Distinguish ionic and covalent bonds', 'Draw dot and cross diagrams', 'Predict bond type between elements', 'Name simple compounds'],
-    terms=[
-        {'term': 'Ion', 'def': 'Atom with a charge (lost or gained electrons)'},
-        {'term': 'Molecule', 'def': 'Group of atoms bonded together'},
-        {'term': 'Ionic Bond', 'def': 'Transfer of electrons (Metal + Non-Metal)'},
-        {'term': 'Covalent Bond', 'def': 'Sharing of electrons (Non-Metal + Non-Metal)'},
-        {'term': 'Valence Shell', 'def': 'Outermost electron shell'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'text', 'title': 'Stability', 'text': 'Atoms bond to become stable, usually by getting a full outer shell of electrons (Octet Rule).'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Ionic Bonding', 'text': 'One atom STEALS electrons from another. Creates + and - ions that attract.'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Metal + Non-Metal', 'text': 'Ionic bonds usually happen between a metal and a non-metal (e.g., NaCl).'},
-        {'sec_idx': 4, 'type': 'text', 'title': 'Covalent Bonding', 'text': 'Atoms SHARE electrons. Like two people holding hands.'},
-        {'sec_idx': 4, 'type': 'image', 'title': 'Water Molecule', 'text': 'H2O is a covalent bond', 'image_url': 'https://images.unsplash.com/photo-1532634993-15f421e42ec0?w=800'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Salt vs Sugar', 'text': 'Salt is Ionic (high melting point), Sugar is Covalent (low melting point).'}
-    ],
-    formulas=[],
-    questions=[
-        {'text': 'In a covalent bond, electrons are...', 'a': 'Transferred', 'b': 'Destroyed', 'c': 'Shared', 'd': 'Doubled', 'ans': 'C', 'exp': 'Co-valent means sharing valence electrons.'},
-        {'text': 'Ionic bonds occur between...', 'a': 'Two metals', 'b': 'Two non-metals', 'c': 'Metal and Non-metal', 'd': 'Noble gases', 'ans': 'C', 'exp': 'Opposites attract (Metal loses, Non-metal gains).'},
-        {'text': 'What charge does an atom get if it loses an electron?', 'a': 'Positive', 'b': 'Negative', 'c': 'Neutral', 'd': 'Unknown', 'ans': 'A', 'exp': 'Losing a negative electron leaves a net positive charge.'},
-        {'text': 'NaCl (Table Salt) is...', 'a': 'Covalent', 'b': 'Ionic', 'c': 'Metallic', 'd': 'Magnetic', 'ans': 'B', 'exp': 'Sodium (Metal) + Chlorine (Non-Metal).'},
-        {'text': 'Why do atoms bond?', 'a': 'To get bigger', 'b': 'To become unstable', 'c': 'To fill outer shell', 'd': 'To change element', 'ans': 'C', 'exp': 'Full outer shell means stability.'}
-    ]
-)
-
-# 10. BIOLOGY - Cell Structure
-add_topic_data('bio-t1',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Cell Theory', 'icon': 'BookOpen', 'type': 'content'},
-        {'title': 'Organelles', 'icon': 'Circle', 'type': 'content'},
-        {'title': 'Plant vs Animal', 'icon': 'Leaf', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['State Cell Theory', 'Identify function of nucleus, mitochondria, cell membrane', 'Distinguish plant and animal cells', 'Understand specialized cells', 'Explain diffusion'],
-    terms=[
-        {'term': 'Organelle', 'def': 'Specialized structure within a cell'},
-        {'term': 'Prokaryote', 'def': 'Simple cell without nucleus (bacteria)'},
-        {'term': 'Eukaryote', 'def': 'Complex cell with nucleus (plants, animals)'},
-        {'term': 'Chloroplast', 'def': 'Site of photosynthesis in plants'},
-        {'term': 'Cell Wall', 'def': 'Rigid outer layer of plant cells'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Unit of Life', 'text': 'Cells are the basic structural and functional units of life.', 'image_url': 'https://images.unsplash.com/photo-1530210124550-912dc1381cb8?w=800'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Mitochondria', 'text': 'The POWERHOUSE of the cell. Generates energy (ATP).'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Nucleus', 'text': 'The BRAIN. Contains DNA and controls cell activity.'},
-        {'sec_idx': 4, 'type': 'concept_helper', 'title': 'Plant Differences', 'text': 'Plant cells have Cell Walls and Chloroplasts. Animal cells do not.'},
-        {'sec_idx': 4, 'type': 'flowchart', 'title': 'Animal vs Plant', 'text': 'Comparison diagram', 'image_url': 'https://mermaid.ink/img/pako:eNpVkEFqwzAQRf8iZtVC_IAeCqWbQsFQAqG7tciyxBZiS0ZSCyX_Xsdf4tJldfPnzZtRo1OooOH1pG_Re3wZ0B0-z_oT12h35sB-tA8B7t0fYq3vHz1G59GfWf8H-sB-sO5Y_8FesC_sA_vAfrAD1lj3w16wL-wD-8B-sIN_xko7bSk0ZChLyYGSY5RKMitrLpdCSM4qWUv5UsmvQnJWkq7kLyU_2T__Xg6HgkKlVLLhQklD5kLKcV0pJYqP61b82x-HqSgN?type=png'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Specialized Cells', 'text': 'Red blood cells have no nucleus to carry more oxygen. Nerve cells are long to send signals.'}
-    ],
-    formulas=[],
-    questions=[
-        {'text': 'Which organelle produces energy?', 'a': 'Ribosome', 'b': 'Nucleus', 'c': 'Mitochondria', 'd': 'Vacuole', 'ans': 'C', 'exp': 'Mitochondria perform cellular respiration to make ATP.'},
-        {'text': 'What is found in plant cells but NOT animal cells?', 'a': 'Nucleus', 'b': 'Cell Wall', 'c': 'Mitochondria', 'd': 'Cell Membrane', 'ans': 'B', 'exp': 'Cell Wall provides rigid structure for plants.'},
-        {'text': 'Control center of the cell?', 'a': 'Nucleus', 'b': 'Cytoplasm', 'c': 'Membrane', 'd': 'Golgi', 'ans': 'A', 'exp': 'Nucleus holds DNA instructions.'},
-        {'text': 'Simple cells like bacteria are...', 'a': 'Eukaryotes', 'b': 'Prokaryotes', 'c': 'Animals', 'd': 'Plants', 'ans': 'B', 'exp': 'Prokaryotes lack a membrane-bound nucleus.'},
-        {'text': 'Photosynthesis happens in...', 'a': 'Mitochondria', 'b': 'Chloroplasts', 'c': 'Ribosomes', 'd': 'Vacuoles', 'ans': 'B', 'exp': 'Chloroplasts contain chlorophyll for photosynthesis.'}
-    ]
-)
-
-# 11. BIOLOGY - Genetics
-add_topic_data('bio-t2',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'DNA', 'icon': 'Dna', 'type': 'content'},
-        {'title': 'Heredity', 'icon': 'GitBranch', 'type': 'content'},
-        {'title': 'Punnett Squares', 'icon': 'Grid', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Describe DNA structure', 'Understand basic inheritance', 'Use Punnett Squares', 'Define genotype and phenotype', 'Understand mutations'],
-    terms=[
-        {'term': 'Gene', 'def': 'Unit of heredity'},
-        {'term': 'Allele', 'def': 'Variant form of a gene (e.g., Blue vs Brown eyes)'},
-        {'term': 'Dominant', 'def': 'Trait that shows up if present (Capital letter)'},
-        {'term': 'Recessive', 'def': 'Trait that is hidden by dominant (Lowercase)'},
-        {'term': 'Genotype', 'def': 'Genetic makeup (e.g., Bb)'},
-        {'term': 'Phenotype', 'def': 'Physical appearance (e.g., Brown eyes)'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Blueprint of Life', 'text': 'DNA holds the instructions for building and operating an organism.', 'image_url': 'https://images.unsplash.com/photo-1576086213369-97a306d36557?w=800'},
-        {'sec_idx': 2, 'type': 'text', 'title': 'Double Helix', 'text': 'DNA looks like a twisted ladder. The rungs are base pairs (A-T, C-G).'},
-        {'sec_idx': 3, 'type': 'concept_helper', 'title': 'Dominant vs Recessive', 'text': 'Dominant traits (like brown eyes) often hide recessive traits (like blue eyes).'},
-        {'sec_idx': 4, 'type': 'text', 'title': 'Punnett Squares', 'text': 'A tool to predict the probability of offspring traits.'},
-        {'sec_idx': 4, 'type': 'image', 'title': 'Punnett Square Example', 'text': 'Crossing Bb x Bb', 'image_url': 'https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Punnett_Square.svg/320px-Punnett_Square.svg.png'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Inheritance', 'text': 'You get half your DNA from mom and half from dad.'}
-    ],
-    formulas=[],
-    questions=[
-        {'text': 'What molecule carries genetic info?', 'a': 'Protein', 'b': 'Carbohydrate', 'c': 'DNA', 'd': 'Lipid', 'ans': 'C', 'exp': 'Deoxyribonucleic Acid.'},
-        {'text': 'Shape of DNA?', 'a': 'Single Helix', 'b': 'Double Helix', 'c': 'Circle', 'd': 'Square', 'ans': 'B', 'exp': 'Twisted ladder shape.'},
-        {'text': 'If B is Brown (dominant) and b is blue (recessive), what is Bb?', 'a': 'Blue', 'b': 'Brown', 'c': 'Green', 'd': 'Mix', 'ans': 'B', 'exp': 'Dominant B masks recessive b.'},
-        {'text': 'Physical appearance is called...', 'a': 'Genotype', 'b': 'Phenotype', 'c': 'Karyotype', 'd': 'Biotype', 'ans': 'B', 'exp': 'Pheno = Physical.'},
-        {'text': 'Probability of bb from Bb x Bb?', 'a': '0%', 'b': '25%', 'c': '50%', 'd': '100%', 'ans': 'B', 'exp': '1 out of 4 squares will be bb.'}
-    ]
-)
-
-# 12. BIOLOGY - Ecosystems
-add_topic_data('bio-t3',
-    sections=[
-        {'title': 'Objectives', 'icon': 'Target', 'type': 'objectives'},
-        {'title': 'Components', 'icon': 'Globe', 'type': 'content'},
-        {'title': 'Food Webs', 'icon': 'Share2', 'type': 'content'},
-        {'title': 'Cycles', 'icon': 'RefreshCw', 'type': 'content'},
-        {'title': 'Quiz', 'icon': 'HelpCircle', 'type': 'quiz'}
-    ],
-    objectives=['Define ecosystem', 'Trace energy flow in food webs', 'Distinguish biotic and abiotic factors', 'Understand carbon and water cycles', 'Identify trophic levels'],
-    terms=[
-        {'term': 'Biotic', 'def': 'Living components (plants, animals)'},
-        {'term': 'Abiotic', 'def': 'Non-living components (sun, water, soil)'},
-        {'term': 'Producer', 'def': 'Organism that makes its own food (plants)'},
-        {'term': 'Consumer', 'def': 'Organism that eats others'},
-        {'term': 'Decomposer', 'def': 'Breaks down dead matter'}
-    ],
-    content=[
-        {'sec_idx': 2, 'type': 'introduction', 'title': 'Web of Life', 'text': 'An ecosystem includes all living things in an area interacting with each other and their environment.', 'image_url': 'https://images.unsplash.com/photo-1470071459604-3b5ec3a7fe05?w=800'},
-        {'sec_idx': 2, 'type': 'concept_helper', 'title': 'Biotic vs Abiotic', 'text': 'Biotic = Living (Wolf). Abiotic = Non-living (Water).'},
-        {'sec_idx': 3, 'type': 'text', 'title': 'Energy Flow', 'text': 'Energy starts from the Sun -> Producers -> Consumers.'},
-        {'sec_idx': 3, 'type': 'warning', 'title': 'Energy Loss', 'text': '90% of energy is lost at each level (heat, movement). Only 10% is passed on.'},
-        {'sec_idx': 3, 'type': 'flowchart', 'title': 'Food Chain', 'text': 'Sun -> Grass -> Rabbit -> Fox', 'image_url': 'https://mermaid.ink/img/pako:eNpVkM1qwzAQhF9FzKqF9AN6KJRQKBhKIHS3FllWbCG2ZCSt0JL3Xsdf4tKldTPfzGhGo1OooOH1rO_RB3wd0B0-z_oT12h35sB-tA8B7t0fYu3vHz3G4NGfWf8H-sB-sO5Y_8FesC_sA_vAfrAD1lj3w16wL-wD-8B-sIN_xko7bSk0ZChLyYGSY5RKMitrLpdCSM4qWUv5UsmvQnJWkq7kLyU_2T__Xg6HgkKlVLLhQklD5kLKcV0pJYqP61b82x-HqSgN?type=png'},
-        {'sec_idx': 4, 'type': 'real_world', 'title': 'Decomposers', 'text': 'Fungi and bacteria recycle nutrients back into the soil. Without them, we would be buried in waste!'}
-    ],
-    formulas=[],
-    questions=[
-        {'text': 'Which is an abiotic factor?', 'a': 'Tree', 'b': 'Bacteria', 'c': 'Sunlight', 'd': 'Wolf', 'ans': 'C', 'exp': 'Sunlight is non-living.'},
-        {'text': 'Organisms that make their own food are...', 'a': 'Consumers', 'b': 'Producers', 'c': 'Decomposers', 'd': 'Predators', 'ans': 'B', 'exp': 'Producers (plants) use photosynthesis.'},
-        {'text': 'How much energy is passed to the next level?', 'a': '100%', 'b': '50%', 'c': '10%', 'd': '0%', 'ans': 'C', 'exp': '10% rule. Rest is lost as heat.'},
-        {'text': 'A network of interconnected food chains is a...', 'a': 'Food Web', 'b': 'Pyramid', 'c': 'Cycle', 'd': 'Biome', 'ans': 'A', 'exp': 'Web implies multiple connections.'},
-        {'text': 'What is the primary source of energy for Earth?', 'a': 'The Moon', 'b': 'Volcanoes', 'c': 'The Sun', 'd': 'Wind', 'ans': 'C', 'exp': 'Sunlight drives photosynthesis.'}
-    ]
-)
+# Opening/closing sections shared by the sample topics: one (title, icon, type)
+# tuple each, referenced from every topic instead of a fresh copy per topic.
+OBJECTIVES_SECTION = ('Objectives', 'Target', 'objectives')
+QUIZ_SECTION = ('Quiz', 'HelpCircle', 'quiz')
+
+
+def _populate_sample_data():
+    """Add every sample topic to SAMPLE_DATA in one bulk insert."""
+    _add_topics([
+        # 1. PHYSICS - Newton's Laws
+        {'topic_id': 'phys-t1',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Introduction', 'BookOpen', 'intro'),
+                ('First Law (Inertia)', 'Zap', 'content'),
+                ('Second Law (F=ma)', 'Calculator', 'content'),
+                ('Third Law (Action-Reaction)', 'Zap', 'content'),
+                ('Assessment', 'HelpCircle', 'quiz')
+            ],
+            'objectives': ['Define inertia and its relationship to mass', 'Apply F=ma to solve problems', 'Identify action-reaction pairs', 'Understand the concept of net force', 'Distinguish between mass and weight'],
+            'terms': [
+                ('Inertia', 'Resistance of any physical object to any change in its velocity'),
+                ('Force', 'A push or pull upon an object resulting from interaction with another object'),
+                ('Mass', 'A measure of the amount of matter in an object'),
+                ('Net Force', 'The vector sum of all forces acting on an object'),
+                ('Acceleration', 'The rate of change of velocity per unit of time')
+            ],
+            'content': [
+                Content(2, 'introduction', 'The Foundations of Dynamics', "Isaac Newton's three laws of motion describe the relationship between the motion of an object and the forces acting on it.", image_url='https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=800'),
+                Content(3, 'concept_helper', 'Law of Inertia', 'An object at rest stays at rest and an object in motion stays in motion unless acted upon by an unbalanced force.'),
+                Content(3, 'real_world', 'Seatbelts', 'When a car stops suddenly, your body keeps moving forward due to inertia. Seatbelts provide the unbalanced force to stop you.'),
+                Content(3, 'warning', 'Inertia is NOT a force', 'Inertia is a property of matter, not a force that pushes you.'),
+                Content(4, 'formula', 'The Equation', 'F = ma'),
+                Content(4, 'text', 'Explanation', 'Force equals mass times acceleration. The more mass an object has, the more force is needed to accelerate it.'),
+                 Content(4, 'concept_helper', 'Proportionality', 'Acceleration is directly proportional to Force and inversely proportional to Mass.'),
+                Content(5, 'text', 'Symmetry in Forces', 'For every action, there is an equal and opposite reaction. Forces always come in pairs.'),
+                Content(5, 'warning', 'Common Mistake', 'Action and reaction forces act on DIFFERENT objects, so they do not cancel each other out!'),
+                Content(5, 'real_world', 'Rocket Propulsion', 'A rocket pushes gas down (action), and the gas pushes the rocket up (reaction).')
+            ],
+            'formulas': [
+                Formula('F = m \\cdot a', "Newton's Second Law", (Var('F', 'Force', 'N'), Var('m', 'Mass', 'kg'), Var('a', 'Acceleration', 'm/s²'))),
+                Formula('W = m \\cdot g', "Weight", (Var('W', 'Weight', 'N'), Var('m', 'Mass', 'kg'), Var('g', 'Gravity', 'm/s²')))
+            ],
+            'questions': [
+                ('Which property of an object determines its inertia?', 'Volume', 'Mass', 'Weight', 'Velocity', 'B', 'Mass is a direct measure of inertia.'),
+                ('If you double the force on an object, what happens to its acceleration?', 'Doubles', 'Halves', 'Quadruples', 'Stays same', 'A', 'Acceleration is directly proportional to force (F=ma).'),
+                ('A 10kg object accelerates at 2 m/s². What is the force?', '5 N', '12 N', '20 N', '0.2 N', 'C', 'F = m * a = 10 * 2 = 20 N.'),
+                ('Which law explains why a book sits still on a table?', '1st Law', '2nd Law', '3rd Law', 'Gravitational Law', 'A', '1st Law: Objects at rest stay at rest unless acted on by unbalanced force.'),
+                ('Action and reaction forces are always...', 'Unequal', 'In the same direction', 'Acting on the same object', 'Equal and opposite', 'D', 'Newton\'s 3rd Law states they are equal in magnitude and opposite in direction.')
+            ]
+        },
+
+        # 2. PHYSICS - Work & Energy
+        {'topic_id': 'phys-t2',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Work', 'Hammer', 'content'),
+                ('Energy Types', 'Zap', 'content'),
+                ('Conservation', 'RefreshCw', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Define Work in physics', 'Distinguish between kinetic and potential energy', 'Apply conservation of energy principle', 'Calculate work and power', 'Understand mechanical advantage'],
+            'terms': [
+                ('Work', 'Force applied over a distance (Joules)'),
+                ('Kinetic Energy', 'Energy of motion'),
+                ('Potential Energy', 'Stored energy due to position or state'),
+                ('Power', 'The rate at which work is done (Watts)'),
+                ('Mechanical Energy', 'Sum of potential and kinetic energy')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Physics Definition of Work', 'In physics, work is done only when a force moves an object. Pushing a wall and not moving it means zero work is done!', image_url='https://images.unsplash.com/photo-1516937941348-c096b542b9c9?w=800'),
+                Content(2, 'formula', 'Work Formula', 'W = F \\cdot d'),
+                Content(2, 'concept_helper', 'Direction Matters', 'The force must be in the same direction as the movement for maximum work.'),
+                Content(3, 'text', 'Kinetic vs Potential', 'A roller coaster at the top has high Potential Energy. As it falls, it converts to Kinetic Energy.'),
+                Content(3, 'video', 'Roller Coaster Physics', 'Watch how energy transforms.', video_url='https://www.youtube.com/watch?v=Jnj8mc04r9E'),
+                Content(4, 'concept_helper', 'Law of Conservation', 'Energy cannot be created or destroyed, only transformed.'),
+                Content(4, 'flowchart', 'Energy Transformation', 'Visualizing how Potential Energy converts to Kinetic Energy.', image_url='https://mermaid.ink/img/pako:eNpVkMtqwzAQRX9FzKqF_IAeCqWbQsFQAqG7tciyxBZiS0ZSCyX_Xsdf4tJldTPn3DszGtToFCpoeD3pW_QeXwZ0h8-z_sQ12p05sB_tQ4B794dY6_tHj9F59GfW_4E-sB-sO9Z_sBfsC_vAPrAf7IA11v2wF-wL-8A-sB_s4J-x0k5bCg0ZylJyoOQYpZJMy5qrpRCSk0pWUp5S8oOQnJSkC_lLyU_2z7-Xw6GgUCqVbLhQ0pCpkHJYl0qJ4uO6Ff_2B2HqSgM?type=png'),
+                Content(4, 'real_world', 'Pendulums', 'A swinging pendulum constantly swaps PE and KE. It stops eventually only because of air resistance (friction).')
+            ],
+            'formulas': [
+                Formula('W = F \\cdot d', 'Work', (Var('W', 'Work', 'J'), Var('F', 'Force', 'N'), Var('d', 'Distance', 'm'))),
+                Formula('KE = \\frac{1}{2}mv^2', 'Kinetic Energy', (Var('KE', 'Energy', 'J'), Var('m', 'Mass', 'kg'), Var('v', 'Velocity', 'm/s'))),
+                Formula('PE_g = mgh', 'Gravitational Potential Energy', (Var('PE', 'Potential Energy', 'J'), Var('m', 'Mass', 'kg'), Var('h', 'Height', 'm')))
+            ],
+            'questions': [
+                ('What is the unit for Work?', 'Newton', 'Watt', 'Joule', 'Meter', 'C', 'Work is measured in Joules (N·m).'),
+                ('A ball held 2m high has what type of energy?', 'Kinetic', 'Gravitational Potential', 'Elastic', 'Thermal', 'B', 'It has potential due to gravity.'),
+                ('If you lift a 5kg box 2 meters, how much work did you do? (g=10)', '10 J', '50 J', '100 J', '7 J', 'C', 'W = Fd = mgd = 5 * 10 * 2 = 100 J.'),
+                ('Energy of motion is called...', 'Potential', 'Kinetic', 'Thermal', 'Chemical', 'B', 'Kinetic comes from the Greek word "kinesis" (motion).'),
+                ('Can energy be destroyed?', 'Yes, by friction', 'Yes, in black holes', 'No, only transformed', 'No, except nuclear', 'C', 'Law of Conservation of Energy states it cannot be created or destroyed.')
+            ]
+        },
+
+        # 3. PHYSICS - Electricity
+        {'topic_id': 'phys-t3',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Circuits', 'Zap', 'content'),
+                ("Ohm's Law", 'Calculator', 'content'),
+                ('Power & Safety', 'AlertTriangle', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Understand circuit components', "Calculate using Ohm's Law", 'Differentiate series and parallel circuits', 'Calculate electrical power', 'Identify electrical safety hazards'],
+            'terms': [
+                ('Voltage', 'Electrical potential difference (Volts)'),
+                ('Current', 'Flow of electric charge (Amps)'),
+                ('Resistance', 'Opposition to current flow (Ohms)'),
+                ('Series Circuit', 'A circuit with only one path for current'),
+                ('Parallel Circuit', 'A circuit with multiple paths for current')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Electric Circuits', 'A closed loop that allows current to flow. Requires a source (battery), load (bulb), and wires.', image_url='https://images.unsplash.com/photo-1549419163-e380e22784cb?w=800'),
+                Content(2, 'concept_helper', 'Series vs Parallel', 'In Series, if one bulb goes out, they all go out. In Parallel, others stay on.'),
+                Content(3, 'formula', "Ohm's Law", 'V = I \\cdot R'),
+                Content(3, 'real_world', 'Resistors', 'Electronics use resistors to control current so delicate components don\'t burn out.'),
+                Content(3, 'text', 'Analogy', 'Voltage is like water pressure, Current is like water flow, Resistance is like a narrow pipe.'),
+                Content(4, 'formula', 'Electrical Power', 'P = I \\cdot V'),
+                Content(4, 'warning', 'Short Circuits', 'Never connect positive directly to negative without a load! It creates dangerous heat.')
+            ],
+            'formulas': [
+                Formula('V = I \\cdot R', "Ohm's Law", (Var('V', 'Voltage', 'V'), Var('I', 'Current', 'A'), Var('R', 'Resistance', 'Ω'))),
+                Formula('P = I \\cdot V', "Electrical Power", (Var('P', 'Power', 'W'), Var('I', 'Current', 'A'), Var('V', 'Voltage', 'V')))
+            ],
+            'questions': [
+                ('What flows in a circuit?', 'Protons', 'Neutrons', 'Electrons', 'Atoms', 'C', 'Current is the flow of electrons.'),
+                ('In which circuit type do all lights go out if one breaks?', 'Parallel', 'Series', 'Open', 'Short', 'B', 'Series circuits have only one path.'),
+                ('If V=12V and R=4Ω, what is the Current?', '3 A', '48 A', '0.33 A', '16 A', 'A', 'I = V/R = 12/4 = 3 Amps.'),
+                ('What unit measures Resistance?', 'Volt', 'Amp', 'Ohm', 'Watt', 'C', 'Ohms (Ω) measure resistance.'),
+                ('What happens to current if resistance increases (Voltage constant)?', 'Increases', 'Decreases', 'Stays same', 'Becomes zero', 'B', 'Current and Resistance are inversely proportional.')
+            ]
+        },
+
+        # 4. MATH - Algebraic Expressions
+        {'topic_id': 'math-t1',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Basics', 'BookOpen', 'content'),
+                ('Simplifying', 'Minimize2', 'content'),
+                ('Expanding & Factoring', 'Maximize2', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Identify variables and coefficients', 'Simplify like terms', 'Expand algebraic expressions using distributive property', 'Factor simple expressions', 'Evaluate expressions'],
+            'terms': [
+                ('Variable', 'A letter representing an unknown number'),
+                ('Coefficient', 'Number multiplying a variable'),
+                ('Constant', 'A fixed value that does not change'),
+                ('Like Terms', 'Terms that have identical variable parts'),
+                ('Distributive Property', 'a(b + c) = ab + ac')
+            ],
+            'content': [
+                Content(2, 'text', 'What is Algebra?', 'Algebra is generalized arithmetic. We use letters to represent numbers we don\'t know yet.'),
+                Content(2, 'image', 'Parts of an Expression', 'Visual breakdown of 3x + 5', image_url='https://upload.wikimedia.org/wikipedia/commons/thumb/1/15/Algebraic_term.svg/320px-Algebraic_term.svg.png'),
+                Content(3, 'concept_helper', 'Like Terms', 'You can only add terms if they have the same variable part. 2x + 3x = 5x, but 2x + 3y cannot be combined.'),
+                Content(3, 'warning', 'Watch the powers', 'x and x² are NOT like terms!'),
+                Content(4, 'formula', 'Distributive Property', 'a(b + c) = ab + ac'),
+                Content(4, 'real_world', 'Budgeting', 'If you buy 3 shirts for $x each and 2 pants for $y each, total cost is 3x + 2y.'),
+                Content(4, 'text', 'Factoring', 'Factoring is the reverse of expanding. 2x + 4 = 2(x + 2).')
+            ],
+            'formulas': [
+                 Formula('a(b + c) = ab + ac', 'Distributive Property', (Var('a', 'Factor', ''), Var('b', 'Term 1', ''), Var('c', 'Term 2', '')))
+            ],
+            'questions': [
+                ('Simplify: 3x + 4y - x', '7xy', '2x + 4y', '6xy', '3x + 3y', 'B', 'Combine 3x and -x to get 2x. 4y stays separate.'),
+                ('Expand: 2(x + 3)', '2x + 3', '2x + 6', 'x + 6', '5x', 'B', 'Multiply 2 by both terms inside: 2*x + 2*3.'),
+                ('What is the coefficient in 5y?', 'y', '5', '5y', 'Unknown', 'B', 'The number multiplying the variable is the coefficient.'),
+                ('Are 3x and 3x² like terms?', 'Yes', 'No', 'Sometimes', 'Only if x=1', 'B', 'No, because the exponents are different.'),
+                ('Evaluate 2x + 1 when x = 4', '6', '7', '9', '8', 'C', '2(4) + 1 = 8 + 1 = 9.')
+            ]
+        },
+
+        # 5. MATH - Geometry: Triangles
+        {'topic_id': 'math-t2',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Types', 'Triangle', 'content'),
+                ('Pythagoras', 'Calculator', 'content'),
+                ('Area & Perimeter', 'Grid', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Classify triangles by sides and angles', 'Use Pythagorean theorem', 'Calculate area of triangles', 'Identify triangle properties', 'Solve real-world problems involving triangles'],
+            'terms': [
+                ('Hypotenuse', 'Longest side of a right triangle'),
+                ('Isosceles', 'Triangle with 2 equal sides'),
+                ('Equilateral', 'Triangle with 3 equal sides'),
+                ('Scalene', 'Triangle with no equal sides'),
+                ('Right Angle', '90 degree angle')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Triangle Types', 'Triangles can be classified by sides (equilateral, isosceles, scalene) or angles (acute, obtuse, right).', image_url='https://images.unsplash.com/photo-1616469829941-c7200ed5dabd?w=800'),
+                Content(2, 'concept_helper', 'Angle Sum', 'The sum of angles in ANY triangle is always 180°.'),
+                Content(3, 'formula', 'Pythagorean Theorem', 'a^2 + b^2 = c^2'),
+                Content(3, 'text', 'Usage', 'Used to find a missing side in a right-angled triangle. c is always the hypotenuse.'),
+                Content(4, 'formula', 'Area of Triangle', 'A = \\frac{1}{2}bh'),
+                Content(4, 'real_world', 'Construction', 'Builders use the 3-4-5 rule (Pythagoras) to check if corners are perfectly square.'),
+                Content(4, 'warning', 'Height must be perpendicular', 'When calculating area, the height must be at a 90° angle to the base.')
+            ],
+            'formulas': [
+                Formula('a^2 + b^2 = c^2', 'Pythagorean Theorem', (Var('c', 'Hypotenuse', ''), Var('a', 'Side A', ''), Var('b', 'Side B', ''))),
+                Formula('A = \\frac{1}{2}b \\cdot h', 'Area of Triangle', (Var('A', 'Area', 'units²'), Var('b', 'Base', 'units'), Var('h', 'Height', 'units')))
+            ],
+            'questions': [
+                ('Which triangle has all equal sides?', 'Isosceles', 'Scalene', 'Equilateral', 'Right', 'C', 'Equi-lateral means equal sides.'),
+                ('Calculate the hypotenuse if sides are 3 and 4.', '5', '6', '7', '25', 'A', '3² + 4² = 9 + 16 = 25. √25 = 5.'),
+                ('Sum of angles in a triangle?', '90', '180', '360', '100', 'B', 'Always 180 degrees.'),
+                ('Area of a triangle with base 10 and height 5?', '50', '25', '15', '100', 'B', '0.5 * 10 * 5 = 25.'),
+                ('A triangle with angles 90, 45, 45 is...', 'Obtuse', 'Acute', 'Right Isosceles', 'Equilateral', 'C', 'Right (has 90°) and Isosceles (two equal angles/sides).')
+            ]
+        },
+
+        # 6. MATH - Probability
+        {'topic_id': 'math-t3',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Chance', 'HelpCircle', 'content'),
+                ('Calculating', 'Calculator', 'content'),
+                ('Multiple Events', 'GitBranch', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Understand probability scale', 'Calculate simple probabilities', 'Determine sample spaces', 'Calculate probability of multiple events', 'Understand complementary events'],
+            'terms': [
+                ('Event', 'An outcome or set of outcomes'),
+                ('Sample Space', 'Set of all possible outcomes'),
+                ('Impossible', 'Probability of 0'),
+                ('Certain', 'Probability of 1 (or 100%)'),
+                ('Independent Events', 'Events where one outcome does not affect the other')
+            ],
+            'content': [
+                Content(2, 'text', 'The Scale', 'Probability ranges from 0 (Impossible) to 1 (Certain). Fractions, decimals, or percentages can be used.'),
+                Content(2, 'image', 'Probability Scale', '0 ----- 0.5 ----- 1', image_url='https://upload.wikimedia.org/wikipedia/commons/thumb/d/d7/Probability_Scale_Line.svg/640px-Probability_Scale_Line.svg.png'),
+                Content(3, 'formula', 'Basic Probability', 'P(A) = \\frac{\\text{favorable outcomes}}{\\text{total outcomes}}'),
+                Content(3, 'real_world', 'Dice', 'Rolling a 6 on a standard die has a 1/6 chance.', image_url='https://images.unsplash.com/photo-1595113316349-9fa4eb24f884?w=800'),
+                Content(3, 'concept_helper', 'Complementary Events', 'P(Not A) = 1 - P(A). Chance of rain is 20%, chance of NO rain is 80%.'),
+                Content(4, 'text', 'Multiple Events', 'For independent events (like flipping two coins), multiply the probabilities.'),
+                Content(4, 'warning', 'Gambler\'s Fallacy', 'Past results do not affect independent future results. The coin doesn\'t "remember" it was heads.')
+            ],
+            'formulas': [
+                Formula('P(A) = \\frac{n(A)}{n(S)}', 'Probability', (Var('P', 'Probability', ''), Var('n(A)', 'Favorable', ''), Var('n(S)', 'Total', ''))),
+                Formula('P(A \\cap B) = P(A) \\times P(B)', 'Independent Events', (Var('P', 'Probability', ''), Var('A', 'Event A', ''), Var('B', 'Event B', '')))
+            ],
+            'questions': [
+                ('Probability of flipping heads?', '0.25', '0.5', '0.75', '1.0', 'B', '1 favorable (heads) / 2 total (heads, tails) = 0.5'),
+                ('Probability of rolling a 7 on a standard die?', '1/6', '1/2', '0', '1', 'C', 'Impossible. Die only goes to 6.'),
+                ('If P(Win) = 0.4, what is P(Lose)?', '0.4', '0.6', '0.5', '0.1', 'B', '1 - 0.4 = 0.6'),
+                ('Probability of flipping heads TWICE in a row?', '0.5', '0.25', '0.1', '0.75', 'B', '0.5 * 0.5 = 0.25'),
+                ('The set of all possible outcomes is called...', 'Event', 'Probability', 'Sample Space', 'Result', 'C', 'Definition of Sample Space.')
+            ]
+        },
+
+        # 7. CHEMISTRY - Atomic Structure
+        {'topic_id': 'chem-t1',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('The Atom', 'Atom', 'content'),
+                ('Subatomic Particles', 'Disc', 'content'),
+                ('Isotopes', 'Copy', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Describe the structure of an atom', 'Identify protons, neutrons, electrons', 'Determine atomic mass and atomic number', 'Understand isotopes', 'Draw simple atomic models'],
+            'terms': [
+                ('Nucleus', 'Central part of atom containing protons/neutrons'),
+                ('Electron Shell', 'Region where electrons orbit'),
+                ('Atomic Number', 'Number of protons (defines the element)'),
+                ('Mass Number', 'Protons + Neutrons'),
+                ('Isotope', 'Same element with different number of neutrons')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Building Blocks', 'All matter is made of atoms. They are the smallest unit of an element.', image_url='https://images.unsplash.com/photo-1614730341194-75c60740a070?w=800'),
+                Content(3, 'text', 'Inside the Atom', 'Protons (+ charge) and Neutrons (no charge) are in the center. Electrons (- charge) zoom around the outside.'),
+                Content(3, 'video', 'Atomic Model', 'Visualizing the atom.', video_url='https://www.youtube.com/watch?v=IO9WS_HNmyg'),
+                Content(3, 'concept_helper', 'Empty Space', 'Atoms are mostly empty space. If the nucleus was a marble, the atom would be a stadium!'),
+                Content(4, 'real_world', 'Carbon Dating', 'We use Carbon-14 (an isotope) to figure out how old ancient fossils are.'),
+                Content(4, 'image', 'Bohr Model', 'Simplified view of electron shells', image_url='https://upload.wikimedia.org/wikipedia/commons/thumb/5/55/Bohr-atom-PAR.svg/320px-Bohr-atom-PAR.svg.png')
+            ],
+            'formulas': [
+                Formula('A = Z + N', 'Mass Number', (Var('A', 'Mass No', ''), Var('Z', 'Protons', ''), Var('N', 'Neutrons', '')))
+            ],
+            'questions': [
+                ('Which particle has a positive charge?', 'Electron', 'Neutron', 'Proton', 'Photon', 'C', 'Protons are positive (+)'),
+                ('Where are electrons found?', 'Nucleus', 'Shells', 'Inside protons', 'Everywhere', 'B', 'Electrons orbit in shells/clouds around the nucleus.'),
+                ('Atomic number tells you the number of...', 'Neutrons', 'Electrons', 'Protons', 'Isotopes', 'C', 'Atomic number = number of protons.'),
+                ('Isotopes have different numbers of...', 'Protons', 'Neutrons', 'Electrons', 'Shells', 'B', 'Isotopes are same element (same protons) but different mass (neutrons).'),
+                ('Most of an atom is...', 'Solid', 'Liquid', 'Empty space', 'Gas', 'C', 'The nucleus is tiny compared to the electron cloud volume.')
+            ]
+        },
+
+        # 8. CHEMISTRY - Periodic Table
+        {'topic_id': 'chem-t2',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Organization', 'Grid', 'content'),
+                ('Groups & Periods', 'ArrowDown', 'content'),
+                ('Metals vs Non-Metals', 'Layers', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Read the Periodic Table', 'Understand Groups and Periods', 'Predict properties based on location', 'Identify metals, non-metals, and metalloids', 'Know common element families'],
+            'terms': [
+                ('Group', 'Vertical column (similar properties)'),
+                ('Period', 'Horizontal row (electron shells)'),
+                ('Alkali Metals', 'Group 1 elements (highly reactive)'),
+                ('Noble Gases', 'Group 18 elements (unreactive)'),
+                ('Halogens', 'Group 17 elements (reactive non-metals)')
+            ],
+            'content': [
+                Content(2, 'introduction', 'The Map of Elements', 'The periodic table organizes all known elements by atomic number and chemical properties.', image_url='https://images.unsplash.com/photo-1603126857599-f6e157fa2fe6?w=800'),
+                Content(3, 'concept_helper', 'Navigation', 'Columns are called Groups (elements behave similarly). Rows are called Periods.'),
+                Content(3, 'real_world', 'Noble Gases', 'Group 18 elements are "Noble Gases" - they are very stable and don\'t like to react (like Neon signs).'),
+                Content(4, 'text', 'Metals vs Non-Metals', 'Metals are on the left (shiny, conduct), Non-metals on the right (dull, insulate). Staircase line separates them.'),
+                Content(4, 'warning', 'Hydrogen Exception', 'Hydrogen is in Group 1 but it is a NON-METAL gas, not a metal.'),
+                Content(4, 'image', 'Periodic Table Sections', 'Color coded regions', image_url='https://upload.wikimedia.org/wikipedia/commons/thumb/3/30/Periodic_Table_Structure.svg/640px-Periodic_Table_Structure.svg.png')
+            ],
+            'formulas': [],
+            'questions': [
+                ('Elements in the same column usually have...', 'Same mass', 'Similar properties', 'Same atomic number', 'Different states', 'B', 'Groups (columns) share chemical properties.'),
+                ('Which group contains the Noble Gases?', '1', '2', '17', '18', 'D', 'Group 18 (far right) are Noble Gases.'),
+                ('Where are metals found on the table?', 'Left', 'Right', 'Top only', 'Bottom only', 'A', 'Metals make up the majority of the left side.'),
+                ('Horizontal rows are called...', 'Groups', 'Families', 'Periods', 'Sections', 'C', 'Periods go across.'),
+                ('Which element is a non-metal in Group 1?', 'Lithium', 'Sodium', 'Hydrogen', 'Potassium', 'C', 'Hydrogen is the exception.')
+            ]
+        },
+
+        # 9. CHEMISTRY - Bonding
+        {'topic_id': 'chem-t3',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Why Bond?', 'Link', 'content'),
+                ('Ionic Bonding', 'Zap', 'content'),
+                ('Covalent Bonding', 'GitCommit', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Explain why atoms bond', 'Distinguish ionic and covalent bonds', 'Draw dot and cross diagrams', 'Predict bond type between elements', 'Name simple compounds'],
+            'terms': [
+                ('Ion', 'Atom with a charge (lost or gained electrons)'),
+                ('Molecule', 'Group of atoms bonded together'),
+                ('Ionic Bond', 'Transfer of electrons (Metal + Non-Metal)'),
+                ('Covalent Bond', 'Sharing of electrons (Non-Metal + Non-Metal)'),
+                ('Valence Shell', 'Outermost electron shell')
+            ],
+            'content': [
+                Content(2, 'text', 'Stability', 'Atoms bond to become stable, usually by getting a full outer shell of electrons (Octet Rule).'),
+                Content(3, 'text', 'Ionic Bonding', 'One atom STEALS electrons from another. Creates + and - ions that attract.'),
+                Content(3, 'concept_helper', 'Metal + Non-Metal', 'Ionic bonds usually happen between a metal and a non-metal (e.g., NaCl).'),
+                Content(4, 'text', 'Covalent Bonding', 'Atoms SHARE electrons. Like two people holding hands.'),
+                Content(4, 'image', 'Water Molecule', 'H2O is a covalent bond', image_url='https://images.unsplash.com/photo-1532634993-15f421e42ec0?w=800'),
+                Content(4, 'real_world', 'Salt vs Sugar', 'Salt is Ionic (high melting point), Sugar is Covalent (low melting point).')
+            ],
+            'formulas': [],
+            'questions': [
+                ('In a covalent bond, electrons are...', 'Transferred', 'Destroyed', 'Shared', 'Doubled', 'C', 'Co-valent means sharing valence electrons.'),
+                ('Ionic bonds occur between...', 'Two metals', 'Two non-metals', 'Metal and Non-metal', 'Noble gases', 'C', 'Opposites attract (Metal loses, Non-metal gains).'),
+                ('What charge does an atom get if it loses an electron?', 'Positive', 'Negative', 'Neutral', 'Unknown', 'A', 'Losing a negative electron leaves a net positive charge.'),
+                ('NaCl (Table Salt) is...', 'Covalent', 'Ionic', 'Metallic', 'Magnetic', 'B', 'Sodium (Metal) + Chlorine (Non-Metal).'),
+                ('Why do atoms bond?', 'To get bigger', 'To become unstable', 'To fill outer shell', 'To change element', 'C', 'Full outer shell means stability.')
+            ]
+        },
+
+        # 10. BIOLOGY - Cell Structure
+        {'topic_id': 'bio-t1',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Cell Theory', 'BookOpen', 'content'),
+                ('Organelles', 'Circle', 'content'),
+                ('Plant vs Animal', 'Leaf', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['State Cell Theory', 'Identify function of nucleus, mitochondria, cell membrane', 'Distinguish plant and animal cells', 'Understand specialized cells', 'Explain diffusion'],
+            'terms': [
+                ('Organelle', 'Specialized structure within a cell'),
+                ('Prokaryote', 'Simple cell without nucleus (bacteria)'),
+                ('Eukaryote', 'Complex cell with nucleus (plants, animals)'),
+                ('Chloroplast', 'Site of photosynthesis in plants'),
+                ('Cell Wall', 'Rigid outer layer of plant cells')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Unit of Life', 'Cells are the basic structural and functional units of life.', image_url='https://images.unsplash.com/photo-1530210124550-912dc1381cb8?w=800'),
+                Content(3, 'text', 'Mitochondria', 'The POWERHOUSE of the cell. Generates energy (ATP).'),
+                Content(3, 'text', 'Nucleus', 'The BRAIN. Contains DNA and controls cell activity.'),
+                Content(4, 'concept_helper', 'Plant Differences', 'Plant cells have Cell Walls and Chloroplasts. Animal cells do not.'),
+                Content(4, 'flowchart', 'Animal vs Plant', 'Comparison diagram', image_url='https://mermaid.ink/img/pako:eNpVkEFqwzAQRf8iZtVC_IAeCqWbQsFQAqG7tciyxBZiS0ZSCyX_Xsdf4tJldfPnzZtRo1OooOH1pG_Re3wZ0B0-z_oT12h35sB-tA8B7t0fYq3vHz1G59GfWf8H-sB-sO5Y_8FesC_sA_vAfrAD1lj3w16wL-wD-8B-sIN_xko7bSk0ZChLyYGSY5RKMitrLpdCSM4qWUv5UsmvQnJWkq7kLyU_2T__Xg6HgkKlVLLhQklD5kLKcV0pJYqP61b82x-HqSgN?type=png'),
+                Content(4, 'real_world', 'Specialized Cells', 'Red blood cells have no nucleus to carry more oxygen. Nerve cells are long to send signals.')
+            ],
+            'formulas': [],
+            'questions': [
+                ('Which organelle produces energy?', 'Ribosome', 'Nucleus', 'Mitochondria', 'Vacuole', 'C', 'Mitochondria perform cellular respiration to make ATP.'),
+                ('What is found in plant cells but NOT animal cells?', 'Nucleus', 'Cell Wall', 'Mitochondria', 'Cell Membrane', 'B', 'Cell Wall provides rigid structure for plants.'),
+                ('Control center of the cell?', 'Nucleus', 'Cytoplasm', 'Membrane', 'Golgi', 'A', 'Nucleus holds DNA instructions.'),
+                ('Simple cells like bacteria are...', 'Eukaryotes', 'Prokaryotes', 'Animals', 'Plants', 'B', 'Prokaryotes lack a membrane-bound nucleus.'),
+                ('Photosynthesis happens in...', 'Mitochondria', 'Chloroplasts', 'Ribosomes', 'Vacuoles', 'B', 'Chloroplasts contain chlorophyll for photosynthesis.')
+            ]
+        },
+
+        # 11. BIOLOGY - Genetics
+        {'topic_id': 'bio-t2',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('DNA', 'Dna', 'content'),
+                ('Heredity', 'GitBranch', 'content'),
+                ('Punnett Squares', 'Grid', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Describe DNA structure', 'Understand basic inheritance', 'Use Punnett Squares', 'Define genotype and phenotype', 'Understand mutations'],
+            'terms': [
+                ('Gene', 'Unit of heredity'),
+                ('Allele', 'Variant form of a gene (e.g., Blue vs Brown eyes)'),
+                ('Dominant', 'Trait that shows up if present (Capital letter)'),
+                ('Recessive', 'Trait that is hidden by dominant (Lowercase)'),
+                ('Genotype', 'Genetic makeup (e.g., Bb)'),
+                ('Phenotype', 'Physical appearance (e.g., Brown eyes)')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Blueprint of Life', 'DNA holds the instructions for building and operating an organism.', image_url='https://images.unsplash.com/photo-1576086213369-97a306d36557?w=800'),
+                Content(2, 'text', 'Double Helix', 'DNA looks like a twisted ladder. The rungs are base pairs (A-T, C-G).'),
+                Content(3, 'concept_helper', 'Dominant vs Recessive', 'Dominant traits (like brown eyes) often hide recessive traits (like blue eyes).'),
+                Content(4, 'text', 'Punnett Squares', 'A tool to predict the probability of offspring traits.'),
+                Content(4, 'image', 'Punnett Square Example', 'Crossing Bb x Bb', image_url='https://upload.wikimedia.org/wikipedia/commons/thumb/2/22/Punnett_Square.svg/320px-Punnett_Square.svg.png'),
+                Content(4, 'real_world', 'Inheritance', 'You get half your DNA from mom and half from dad.')
+            ],
+            'formulas': [],
+            'questions': [
+                ('What molecule carries genetic info?', 'Protein', 'Carbohydrate', 'DNA', 'Lipid', 'C', 'Deoxyribonucleic Acid.'),
+                ('Shape of DNA?', 'Single Helix', 'Double Helix', 'Circle', 'Square', 'B', 'Twisted ladder shape.'),
+                ('If B is Brown (dominant) and b is blue (recessive), what is Bb?', 'Blue', 'Brown', 'Green', 'Mix', 'B', 'Dominant B masks recessive b.'),
+                ('Physical appearance is called...', 'Genotype', 'Phenotype', 'Karyotype', 'Biotype', 'B', 'Pheno = Physical.'),
+                ('Probability of bb from Bb x Bb?', '0%', '25%', '50%', '100%', 'B', '1 out of 4 squares will be bb.')
+            ]
+        },
+
+        # 12. BIOLOGY - Ecosystems
+        {'topic_id': 'bio-t3',
+            'sections': [
+                OBJECTIVES_SECTION,
+                ('Components', 'Globe', 'content'),
+                ('Food Webs', 'Share2', 'content'),
+                ('Cycles', 'RefreshCw', 'content'),
+                QUIZ_SECTION
+            ],
+            'objectives': ['Define ecosystem', 'Trace energy flow in food webs', 'Distinguish biotic and abiotic factors', 'Understand carbon and water cycles', 'Identify trophic levels'],
+            'terms': [
+                ('Biotic', 'Living components (plants, animals)'),
+                ('Abiotic', 'Non-living components (sun, water, soil)'),
+                ('Producer', 'Organism that makes its own food (plants)'),
+                ('Consumer', 'Organism that eats others'),
+                ('Decomposer', 'Breaks down dead matter')
+            ],
+            'content': [
+                Content(2, 'introduction', 'Web of Life', 'An ecosystem includes all living things in an area interacting with each other and their environment.', image_url='https://images.unsplash.com/photo-1470071459604-3b5ec3a7fe05?w=800'),
+                Content(2, 'concept_helper', 'Biotic vs Abiotic', 'Biotic = Living (Wolf). Abiotic = Non-living (Water).'),
+                Content(3, 'text', 'Energy Flow', 'Energy starts from the Sun -> Producers -> Consumers.'),
+                Content(3, 'warning', 'Energy Loss', '90% of energy is lost at each level (heat, movement). Only 10% is passed on.'),
+                Content(3, 'flowchart', 'Food Chain', 'Sun -> Grass -> Rabbit -> Fox', image_url='https://mermaid.ink/img/pako:eNpVkM1qwzAQhF9FzKqF9AN6KJRQKBhKIHS3FllWbCG2ZCSt0JL3Xsdf4tKldTPfzGhGo1OooOH1rO_RB3wd0B0-z_oT12h35sB-tA8B7t0fYu3vHz3G4NGfWf8H-sB-sO5Y_8FesC_sA_vAfrAD1lj3w16wL-wD-8B-sIN_xko7bSk0ZChLyYGSY5RKMitrLpdCSM4qWUv5UsmvQnJWkq7kLyU_2T__Xg6HgkKlVLLhQklD5kLKcV0pJYqP61b82x-HqSgN?type=png'),
+                Content(4, 'real_world', 'Decomposers', 'Fungi and bacteria recycle nutrients back into the soil. Without them, we would be buried in waste!')
+            ],
+            'formulas': [],
+            'questions': [
+                ('Which is an abiotic factor?', 'Tree', 'Bacteria', 'Sunlight', 'Wolf', 'C', 'Sunlight is non-living.'),
+                ('Organisms that make their own food are...', 'Consumers', 'Producers', 'Decomposers', 'Predators', 'B', 'Producers (plants) use photosynthesis.'),
+                ('How much energy is passed to the next level?', '100%', '50%', '10%', '0%', 'C', '10% rule. Rest is lost as heat.'),
+                ('A network of interconnected food chains is a...', 'Food Web', 'Pyramid', 'Cycle', 'Biome', 'A', 'Web implies multiple connections.'),
+                ('What is the primary source of energy for Earth?', 'The Moon', 'Volcanoes', 'The Sun', 'Wind', 'C', 'Sunlight drives photosynthesis.')
+            ]
+        },
+    ])
+
+
+# `python setup_data.py freeze-sample` pickles the built SAMPLE_DATA next to this
+# script so later runs load it instead of rebuilding every topic. Its first
+# line holds a hash of this file, so it is ignored as soon as the file changes.
+SAMPLE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_data.pkl')
+
+
+def _source_fingerprint():
+    """Hash of this script, used to detect a stale frozen sample."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _frozen_header():
+    """First line of sample_data.pkl: a tag plus this script's fingerprint."""
+    return b'studyhub-sample ' + _source_fingerprint().encode('ascii') + b'\n'
+
+
+def _load_frozen_sample_data(path=SAMPLE_CACHE_PATH):
+    """Return the frozen SAMPLE_DATA if it exists and matches this script, else None.
+
+    The fingerprint header is checked before anything is unpickled, so a
+    stale or foreign file is never loaded; any unreadable or wrongly shaped
+    pickle also falls back to rebuilding the sample.
+    """
+    try:
+        with open(path, 'rb') as f:
+            if f.readline() != _frozen_header():
+                return None
+            frozen = pickle.load(f)
+        if not isinstance(frozen, dict) or frozen.keys() != SAMPLE_DATA.keys():
+            return None
+        for sheet_name, table in frozen.items():
+            if not isinstance(table, dict) or list(table) != list(_sheet_columns(sheet_name)):
+                return None
+    except Exception:
+        return None
+    return frozen
+
+
+@lru_cache(maxsize=None)
+def get_sample_data():
+    """Fill in SAMPLE_DATA's per-topic sheets on first use and return it.
+
+    Only the Subjects, Topics and Achievements sheets are built at import;
+    commands that never write the sample (validate, schema, ...) skip the
+    topic bodies entirely. Repeated values in the finished columns are
+    shared; callers adding topics go through add_topic_data, which runs this
+    first so the sample (or its frozen copy) never lands on top of them.
+    """
+    frozen = _load_frozen_sample_data()
+    if frozen is not None:
+        SAMPLE_DATA.update(frozen)
+    else:
+        _populate_sample_data()
+        pool = {}
+        for table in SAMPLE_DATA.values():
+            _intern_table(table, pool)
+    return SAMPLE_DATA
 
 
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
 
-def create_sample_excel(output_path='public/StudyHub_Complete_Data.xlsx'):
-    """Create a sample Excel file with all the required sheets and data."""
-    print(f"Creating sample Excel file: {output_path}")
-    
-    wb = Workbook()
-    
-    # Styling
-    header_font = Font(bold=True, color='FFFFFF', size=11)
-    header_fill = PatternFill('solid', fgColor='4472C4')
-    thin_border = Border(
-        left=Side(style='thin'), right=Side(style='thin'),
-        top=Side(style='thin'), bottom=Side(style='thin')
-    )
+def _sheet_columns(sheet_name):
+    """Return the schema column order for a sheet."""
+    return SHEET_SCHEMAS[sheet_name]['columns']
+
+
+def _sheet_rows(sheet_name, table):
+    """Yield a sheet's rows as plain tuples in schema column order."""
+    return zip(*(table[col] for col in _sheet_columns(sheet_name)))
+
+
+def _column_widths(columns, table):
+    """Compute display widths for each column, capped at 50 characters."""
+    # Each column buffer is scanned once with C-level map() calls; no per-row
+    # dict lookups or Python-level loop bodies.
+    return [min(max(len(col_name), max(map(len, map(str, table[col_name])), default=0)) + 2, 50)
+            for col_name in columns]
+
+
+def _create_sample_excel_fast(output_path):
+    """Write SAMPLE_DATA with the Rust-backed rustpy_xlsxwriter."""
+    # Every sheet is chained onto one writer in this process. The writer does
+    # its XML generation in Rust, so per-sheet worker processes would only add
+    # pickling and process start-up cost.
+    import pandas as pd
+    from rustpy_xlsxwriter import FastExcel, Format
+
+    header_format = (Format().set_bold().set_font_color('#FFFFFF')
+                     .set_background_color('#4472C4').set_border('thin').set_align('center'))
+    writer = FastExcel(output_path, autofit=False)
+    for sheet_name, table in SAMPLE_DATA.items():
+        columns = _sheet_columns(sheet_name)
+        # The column buffers become a DataFrame without any row transpose, and
+        # the writer reads it through Arrow rather than per-cell Python objects.
+        df = pd.DataFrame(table, columns=columns)
+        writer.sheet(sheet_name, df, header_format=header_format,
+                     column_widths=_column_widths(columns, table))
+    writer.save()
+
+
+def _create_sample_excel_openpyxl(output_path):
+    """Write SAMPLE_DATA with openpyxl in write-only (streaming) mode."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import NamedStyle
+    from openpyxl.utils import get_column_letter
+
+    header_font, header_fill, thin_border, header_alignment = _header_style()
+    wb = Workbook(write_only=True)
+    # Register the header look once; each header cell then sets one style name
+    wb.add_named_style(NamedStyle(name='header', font=header_font, fill=header_fill,
+                                  border=thin_border, alignment=header_alignment))
     
-    for i, (sheet_name, data) in enumerate(SAMPLE_DATA.items()):
-        if i == 0:
-            ws = wb.active
-            ws.title = sheet_name
-        else:
-            ws = wb.create_sheet(sheet_name)
+    for sheet_name, table in SAMPLE_DATA.items():
+        ws = wb.create_sheet(sheet_name)
+        columns = _sheet_columns(sheet_name)
         
-        schema = SHEET_SCHEMAS.get(sheet_name, {})
-        columns = schema.get('columns', list(data[0].keys()) if data else [])
+        # Column widths must be set before the first row is streamed
+        for col_idx, width in enumerate(_column_widths(columns, table), 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
         
         # Write headers
-        for col, header in enumerate(columns, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal='center')
-        
-        # Write data
-        for row_idx, row_data in enumerate(data, 2):
-            for col_idx, col_name in enumerate(columns, 1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=row_data.get(col_name, ''))
-                cell.border = thin_border
+        header_cells = []
+        for header in columns:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = 'header'
+            header_cells.append(cell)
+        ws.append(header_cells)
         
-        # Auto-adjust column widths
-        for col_idx, col_name in enumerate(columns, 1):
-            max_length = max(len(str(col_name)), max(len(str(row.get(col_name, ''))) for row in data) if data else 0)
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_length + 2, 50)
+        # Write data: zip the column buffers straight into row tuples
+        for row in _sheet_rows(sheet_name, table):
+            ws.append(row)
+
+    wb.save(output_path)
+
+
+def _ensure_dir(directory):
+    """Create directory if needed; '' (the current directory) is left alone."""
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+
+def create_sample_excel(output_path='public/StudyHub_Complete_Data.xlsx'):
+    """Create a sample Excel file with all the required sheets and data."""
+    print(f"Creating sample Excel file: {output_path}")
+    get_sample_data()
     
     # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(output_path))
+
+    if HAS_FAST_EXCEL:
+        _create_sample_excel_fast(output_path)
+    else:
+        _create_sample_excel_openpyxl(output_path)
 
-    wb.save(output_path)
     print(f"✅ Sample Excel file created: {output_path}")
     print(f"   Sheets created: {', '.join(SAMPLE_DATA.keys())}")
     return output_path
 
 
+@lru_cache(maxsize=None)
+def _normalise_header(header):
+    """Snake-case a header cell ('Topic ID' -> 'topic_id'), interned and cached per distinct header."""
+    return sys.intern(header.lower().replace(' ', '_'))
+
+
+def _read_sheets(file_path):
+    """Read every sheet into a DataFrame with normalised (snake_case) headers."""
+    import pandas as pd
+
+    pandas_version = tuple(int(part) for part in pd.__version__.split('.')[:2] if part.isdigit())
+    engine = 'calamine' if HAS_CALAMINE and pandas_version >= (2, 2) else 'openpyxl'
+    sheets = pd.read_excel(file_path, sheet_name=None, engine=engine)
+    for df in sheets.values():
+        df.columns = [_normalise_header(str(h)) for h in df.columns]
+    return sheets
+
+
+def _invalid_rows(series, valid_values):
+    """Return (excel_row, value) pairs whose non-empty value is not in valid_values."""
+    present = series.notna() & (series != '')
+    bad = series[present & ~series.isin(valid_values)]
+    return [(idx + 2, value) for idx, value in bad.items()]
+
+
+def freeze_sample_data():
+    """Pickle SAMPLE_DATA (protocol 5) so later runs can skip rebuilding it."""
+    get_sample_data()
+    with open(SAMPLE_CACHE_PATH, 'wb') as f:
+        f.write(_frozen_header())
+        pickle.dump(SAMPLE_DATA, f, protocol=5)
+    print(f"✅ Sample data frozen: {SAMPLE_CACHE_PATH}")
+    return SAMPLE_CACHE_PATH
+
+
 def validate_excel(file_path):
     """Validate an Excel file against the required schema."""
     print(f"Validating: {file_path}")
@@ -745,49 +1136,48 @@ def validate_excel(file_path):
     warnings = []
     
     try:
-        wb = load_workbook(file_path)
+        sheets = _read_sheets(file_path)
     except Exception as e:
         print(f"❌ Error opening file: {e}")
         return False
     
     # Check for required sheets
     for sheet_name, schema in SHEET_SCHEMAS.items():
-        if sheet_name not in wb.sheetnames:
+        if sheet_name not in sheets:
             errors.append(f"Missing required sheet: {sheet_name}")
             continue
         
-        ws = wb[sheet_name]
-        
-        # Get headers from first row
-        headers = [cell.value for cell in ws[1] if cell.value]
-        headers_lower = [h.lower().replace(' ', '_') if h else '' for h in headers]
+        # Fully blank rows are skipped, not reported once per required column;
+        # dropna keeps the original index, so row numbers stay correct
+        df = sheets[sheet_name].dropna(how='all')
         
-        # Check required columns
+        # Check required columns (and that every row fills them in)
         for required_col in schema.get('required', []):
-            if required_col not in headers_lower:
+            if required_col not in df.columns:
                 errors.append(f"{sheet_name}: Missing required column '{required_col}'")
+            elif df[required_col].isna().any():
+                missing = int(df[required_col].isna().sum())
+                warnings.append(f"{sheet_name}: {missing} row(s) missing a value for required column '{required_col}'")
         
         # Check for data
-        if ws.max_row < 2:
+        if df.empty:
             warnings.append(f"{sheet_name}: No data rows found")
         
-        # Validate content types for Study_Content
-        if sheet_name == 'Study_Content' and 'content_type' in headers_lower:
-            type_col = headers_lower.index('content_type') + 1
-            for row in range(2, ws.max_row + 1):
-                cell_value = ws.cell(row=row, column=type_col).value
-                if cell_value and cell_value not in CONTENT_TYPES:
-                    warnings.append(f"{sheet_name} row {row}: Invalid content_type '{cell_value}'. Valid: {CONTENT_TYPES}")
-        
-        # Validate icons
-        if sheet_name in ['Subjects', 'Topic_Sections', 'Achievements']:
-            icon_col_name = 'icon' if sheet_name != 'Topic_Sections' else 'section_icon'
-            if icon_col_name in headers_lower:
-                icon_col = headers_lower.index(icon_col_name) + 1
-                for row in range(2, ws.max_row + 1):
-                    cell_value = ws.cell(row=row, column=icon_col).value
-                    if cell_value and cell_value not in VALID_ICONS:
-                        warnings.append(f"{sheet_name} row {row}: Unknown icon '{cell_value}'")
+        # Validate content types and icons
+        if sheet_name in VOCABULARY_CHECKS:
+            column, valid_values, message = VOCABULARY_CHECKS[sheet_name]
+            if column in df.columns:
+                for row, value in _invalid_rows(df[column], valid_values):
+                    warnings.append(f"{sheet_name} row {row}: " + message.format(value))
+    
+    # Check references between sheets (e.g. every Topics.subject_key exists in Subjects)
+    for sheet_name, schema in SHEET_SCHEMAS.items():
+        for column, (parent_sheet, parent_column) in schema.get('references', {}).items():
+            child, parent = sheets.get(sheet_name), sheets.get(parent_sheet)
+            if child is None or parent is None or column not in child.columns or parent_column not in parent.columns:
+                continue
+            for row, value in _invalid_rows(child[column], parent[parent_column]):
+                warnings.append(f"{sheet_name} row {row}: {column} '{value}' not found in {parent_sheet}")
     
     # Print results
     print("\n" + "="*50)
@@ -812,6 +1202,50 @@ def validate_excel(file_path):
     return len(errors) == 0
 
 
+def _sheet_records(ws):
+    """Yield each non-empty data row of a worksheet as a {header: value} dict."""
+    sheet_rows = ws.iter_rows(values_only=True)
+    
+    # Get headers
+    headers = [_normalise_header(header) if header else f'col_{i}' 
+               for i, header in enumerate(next(sheet_rows, ()))]
+    
+    # Integer columns read back as whole floats (1.0) from the rustpy-xlsxwriter
+    # sample; turn those back into ints so the JSON doesn't depend on the writer
+    integer_headers = [header for header in headers if header in INTEGER_COLUMNS]
+    
+    # Get data
+    for row in sheet_rows:
+        if any(cell is not None for cell in row):
+            # zip stops at the shorter of headers and row
+            record = {header: value if value is not None else '' for header, value in zip(headers, row)}
+            for header in integer_headers:
+                value = record.get(header)
+                if isinstance(value, float) and value.is_integer():
+                    record[header] = int(value)
+            yield record
+
+
+def _write_json_sheets(f, sheets):
+    """Stream (sheet_name, rows) pairs to f as one indented JSON object.
+
+    Output matches _json_dumps()({sheet_name: [rows...]}) byte for byte, but
+    only one row is serialised at a time.
+    """
+    dumps = _json_dumps()
+    f.write(b'{')
+    first_sheet = True
+    for sheet_name, rows in sheets:
+        f.write((b'\n  ' if first_sheet else b',\n  ') + dumps(sheet_name) + b': [')
+        first_sheet = False
+        first_row = True
+        for row in rows:
+            f.write((b'\n    ' if first_row else b',\n    ') + dumps(row).replace(b'\n', b'\n    '))
+            first_row = False
+        f.write(b']' if first_row else b'\n  ]')
+    f.write(b'}' if first_sheet else b'\n}')
+
+
 def export_to_json(file_path, output_path=None):
     """Export Excel data to JSON format for use without Google Sheets."""
     print(f"Exporting to JSON: {file_path}")
@@ -819,30 +1253,26 @@ def export_to_json(file_path, output_path=None):
     if output_path is None:
         output_path = file_path.replace('.xlsx', '.json')
     
-    wb = load_workbook(file_path)
-    data = {}
+    if os.path.realpath(output_path) == os.path.realpath(file_path):
+        raise ValueError(f"JSON output would overwrite the input workbook: {file_path}")
     
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        
-        # Get headers
-        headers = [cell.value.lower().replace(' ', '_') if cell.value else f'col_{i}' 
-                   for i, cell in enumerate(ws[1])]
-        
-        # Get data
-        rows = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if any(cell is not None for cell in row):
-                row_dict = {}
-                for i, value in enumerate(row):
-                    if i < len(headers):
-                        row_dict[headers[i]] = value if value is not None else ''
-                rows.append(row_dict)
-        
-        data[sheet_name] = rows
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    from openpyxl import load_workbook
+
+    # Read-only mode streams each sheet's XML instead of building every Cell,
+    # and rows go straight to a temporary file, so no sheet is held in memory
+    # whole; it only replaces output_path once every sheet has been written
+    tmp_path = output_path + '.tmp'
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        with open(tmp_path, 'wb') as f:
+            _write_json_sheets(f, ((sheet_name, _sheet_records(wb[sheet_name])) for sheet_name in wb.sheetnames))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        wb.close()
     
     print(f"✅ JSON exported: {output_path}")
     return output_path
@@ -861,12 +1291,44 @@ def print_schema():
         print(f"   Required: {', '.join(schema['required'])}")
     
     print("\n" + "-"*60)
-    print("VALID CONTENT TYPES:", ', '.join(CONTENT_TYPES))
-    print("VALID SECTION TYPES:", ', '.join(SECTION_TYPES))
-    print("VALID ICONS:", ', '.join(VALID_ICONS))
+    print("VALID CONTENT TYPES:", ', '.join(CONTENT_TYPES_ORDER))
+    print("VALID SECTION TYPES:", ', '.join(SECTION_TYPES_ORDER))
+    print("VALID ICONS:", ', '.join(VALID_ICONS_ORDER))
     print("="*60)
 
 
+COVERAGE_SHEETS = ('Subjects', 'Topics', 'Learning_Objectives', 'Key_Terms', 'Study_Content', 'Quiz_Questions')
+
+
+def _read_sheet_records(file_path, sheet_names):
+    """Read the named sheets as {sheet_name: [{header: value}, ...]}."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        sheets = {}
+        for sheet_name in sheet_names:
+            if sheet_name not in wb.sheetnames:
+                continue
+            # ws.values yields plain value tuples, header row first, without
+            # materialising Cell objects
+            rows = wb[sheet_name].values
+            headers = [_normalise_header(h) if h else '' for h in next(rows, ())]
+            sheets[sheet_name] = [dict(zip(headers, row)) for row in rows if any(row)]
+        return sheets
+    finally:
+        wb.close()
+
+
+def _id_prefixes(section_id):
+    """Yield section_id and each prefix of it that ends just before a '-'."""
+    yield section_id
+    i = section_id.find('-')
+    while i != -1:
+        yield section_id[:i]
+        i = section_id.find('-', i + 1)
+
+
 def validate_coverage(file_path):
     """
     Validate that the data meets minimum content coverage requirements.
@@ -879,27 +1341,33 @@ def validate_coverage(file_path):
     print(f"Validating Content Coverage: {file_path}")
 
     try:
-        wb = load_workbook(file_path)
+        sheets = _read_sheet_records(file_path, COVERAGE_SHEETS)
     except Exception as e:
         print(f"❌ Error opening file: {e}")
         return False
 
-    def get_data(sheet_name):
-        if sheet_name not in wb.sheetnames: return []
-        ws = wb[sheet_name]
-        headers = [c.value.lower().replace(' ', '_') if c.value else '' for c in ws[1]]
-        data = []
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if any(row):
-                data.append({k: v for k, v in zip(headers, row)})
-        return data
-
-    subjects = get_data('Subjects')
-    topics = get_data('Topics')
-    objectives = get_data('Learning_Objectives')
-    terms = get_data('Key_Terms')
-    content = get_data('Study_Content')
-    questions = get_data('Quiz_Questions')
+    subjects = sheets.get('Subjects', [])
+    topics = sheets.get('Topics', [])
+    objectives = sheets.get('Learning_Objectives', [])
+    terms = sheets.get('Key_Terms', [])
+    content = sheets.get('Study_Content', [])
+    questions = sheets.get('Quiz_Questions', [])
+
+    # Group rows by topic/subject once instead of rescanning every sheet per topic
+    topics_by_subject = defaultdict(list)
+    for t in topics:
+        topics_by_subject[t.get('subject_key')].append(t)
+    objective_counts = Counter(o.get('topic_id') for o in objectives)
+    term_counts = Counter(t.get('topic_id') for t in terms)
+    question_counts = Counter(q.get('topic_id') for q in questions)
+    # Handout content per topic: a row counts for every topic id its section
+    # id equals or starts with up to a '-' (so 'chem-t2-intro-1' counts for
+    # 'chem-t2', but 'phys-t10-s1' does not count for 'phys-t1')
+    handout_counts = Counter(
+        prefix
+        for c in content if c.get('content_type') in HANDOUT_CONTENT_TYPES
+        for prefix in _id_prefixes(str(c.get('section_id') or ''))
+    )
 
     errors = []
 
@@ -910,7 +1378,7 @@ def validate_coverage(file_path):
     # 2. Topic Coverage per Subject
     for sub in subjects:
         sub_key = sub.get('subject_key')
-        sub_topics = [t for t in topics if t.get('subject_key') == sub_key]
+        sub_topics = topics_by_subject.get(sub_key, [])
         if len(sub_topics) < 3:
             errors.append(f"Subject '{sub.get('name')}' has only {len(sub_topics)} topics (min 3 required)")
 
@@ -920,26 +1388,20 @@ def validate_coverage(file_path):
             tname = topic.get('topic_name')
 
             # Check Objectives
-            t_objs = [o for o in objectives if o.get('topic_id') == tid]
-            if not t_objs:
+            if not objective_counts[tid]:
                 errors.append(f"Topic '{tname}' ({tid}) missing Learning Objectives")
 
             # Check Terms
-            t_terms = [t for t in terms if t.get('topic_id') == tid]
-            if not t_terms:
+            if not term_counts[tid]:
                 errors.append(f"Topic '{tname}' ({tid}) missing Key Terms")
 
             # Check Quiz
-            t_quiz = [q for q in questions if q.get('topic_id') == tid]
-            if len(t_quiz) < 3:
-                errors.append(f"Topic '{tname}' ({tid}) has {len(t_quiz)} quiz questions (min 3 required)")
+            quiz_count = question_counts[tid]
+            if quiz_count < 3:
+                errors.append(f"Topic '{tname}' ({tid}) has {quiz_count} quiz questions (min 3 required)")
 
             # Check Handout Content
-            # Valid types for handout: 'formula', 'concept_helper', 'warning', 'real_world', 'flowchart', 'image'
-            valid_types = ['formula', 'concept_helper', 'warning', 'real_world', 'flowchart', 'image']
-            t_content = [c for c in content if c.get('section_id', '').startswith(tid) and c.get('content_type') in valid_types]
-
-            if not t_content:
+            if not handout_counts[tid]:
                 errors.append(f"Topic '{tname}' ({tid}) missing Handout-compatible content (concept_helper, real_world, etc.)")
 
     print("\n" + "="*50)
@@ -953,44 +1415,150 @@ def validate_coverage(file_path):
         return True
 
 
-def main():
-    """Main entry point."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='StudyHub Data Setup Script')
-    parser.add_argument('command', choices=['create-sample', 'validate', 'validate-coverage', 'export-json', 'schema'],
-                       help='Command to run')
-    parser.add_argument('file', nargs='?', help='Input file path (for validate/export-json)')
-    parser.add_argument('-o', '--output', help='Output file path')
-    
-    args = parser.parse_args()
-    
-    if args.command == 'create-sample':
-        output = args.output or 'public/StudyHub_Complete_Data.xlsx'
-        create_sample_excel(output)
-    
-    elif args.command == 'validate':
-        if not args.file:
-            print("Error: Please provide a file path to validate")
-            sys.exit(1)
-        success = validate_excel(args.file)
-        sys.exit(0 if success else 1)
-
-    elif args.command == 'validate-coverage':
-        if not args.file:
-            print("Error: Please provide a file path to validate")
-            sys.exit(1)
-        success = validate_coverage(args.file)
-        sys.exit(0 if success else 1)
-    
-    elif args.command == 'export-json':
-        if not args.file:
-            print("Error: Please provide a file path to export")
-            sys.exit(1)
-        export_to_json(args.file, args.output)
-    
-    elif args.command == 'schema':
-        print_schema()
+USAGE = f"""usage: setup_data.py <command> [file] [-o OUTPUT] [--install-deps]
+
+StudyHub Data Setup Script
+
+commands:
+  create-sample       Create the sample Excel file (default: public/StudyHub_Complete_Data.xlsx)
+  freeze-sample       Cache the built sample data in sample_data.pkl
+  validate FILE       Validate an Excel file against the schema
+  validate-coverage FILE
+                      Check every topic has objectives, terms, handouts and quizzes
+  export-json FILE    Export an Excel file to JSON
+  schema              Print the data schema
+
+options:
+  -h, --help          Show this help message and exit
+  -o, --output OUTPUT Output file path
+  --install-deps      Install missing required packages ({', '.join(REQUIRED_PACKAGES)}) before running
+
+Tip: pip install python-calamine for ~10x faster workbook parsing in validate."""
+
+
+def _usage_error(message):
+    """Print usage and message to stderr, then exit 2 (as argparse does)."""
+    print(USAGE.splitlines()[0], file=sys.stderr)
+    print(f"setup_data.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+CliArgs = namedtuple('CliArgs', ['command', 'file', 'output', 'install_deps'])
+
+
+def _parse_args(argv):
+    """Parse the command line into CliArgs(command, file, output, install_deps).
+
+    Options may come before or after the command, as with the original
+    argparse parser: -o VALUE, -oVALUE, --output VALUE, --output=VALUE and
+    --install-deps. A missing option value, an unknown flag or a third
+    positional is a usage error.
+    """
+    positional, output, install_deps = [], None, False
+    args = iter(argv)
+    for arg in args:
+        if arg in ('-o', '--output'):
+            output = next(args, None)
+            if output is None or output.startswith('-'):
+                _usage_error("argument -o/--output: expected one argument")
+        elif arg.startswith('--output='):
+            output = arg.split('=', 1)[1]
+        elif arg.startswith('-o') and not arg.startswith('--'):
+            output = arg[2:]
+        elif arg == '--install-deps':
+            install_deps = True
+        elif arg in ('-h', '--help'):
+            cmd_help()
+            sys.exit(0)
+        elif arg.startswith('-') and arg != '-':
+            _usage_error(f"unrecognized arguments: {arg}")
+        else:
+            positional.append(arg)
+    if len(positional) > 2:
+        _usage_error(f"unrecognized arguments: {' '.join(positional[2:])}")
+    positional += [None] * (2 - len(positional))
+    return CliArgs(positional[0], positional[1], output, install_deps)
+
+
+def _require_file(args, action):
+    """Return args.file, exiting with an error if no file was given."""
+    if not args.file:
+        print(f"Error: Please provide a file path to {action}")
+        sys.exit(1)
+    return args.file
+
+
+def cmd_help(args=None):
+    """Print usage."""
+    print(USAGE)
+
+
+def cmd_create_sample(args):
+    """create-sample [-o OUTPUT]"""
+    if not HAS_FAST_EXCEL:
+        _require('openpyxl')
+    create_sample_excel(args.output or 'public/StudyHub_Complete_Data.xlsx')
+
+
+def cmd_freeze_sample(args):
+    """freeze-sample"""
+    freeze_sample_data()
+
+
+def cmd_validate(args):
+    """validate FILE"""
+    file_path = _require_file(args, 'validate')
+    _require('pandas', 'openpyxl')
+    sys.exit(0 if validate_excel(file_path) else 1)
+
+
+def cmd_validate_coverage(args):
+    """validate-coverage FILE"""
+    file_path = _require_file(args, 'validate')
+    _require('openpyxl')
+    sys.exit(0 if validate_coverage(file_path) else 1)
+
+
+def cmd_export_json(args):
+    """export-json FILE [-o OUTPUT]"""
+    file_path = _require_file(args, 'export')
+    _require('openpyxl')
+    try:
+        export_to_json(file_path, args.output)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_schema(args):
+    """schema"""
+    print_schema()
+
+
+COMMANDS = {
+    'create-sample': cmd_create_sample,
+    'freeze-sample': cmd_freeze_sample,
+    'validate': cmd_validate,
+    'validate-coverage': cmd_validate_coverage,
+    'export-json': cmd_export_json,
+    'schema': cmd_schema,
+}
+
+
+def main(argv=None):
+    """Main entry point: parse the whole command line, then run its command handler."""
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.install_deps:
+        _ensure_deps()
+    if args.command is None:
+        cmd_help()
+        return
+    handler = COMMANDS.get(args.command)
+    if handler is None:
+        print(f"Error: unknown command '{args.command}'\n")
+        cmd_help()
+        sys.exit(2)
+    handler(args)
 
 
 if __name__ == '__main__':
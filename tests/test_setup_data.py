@@ -0,0 +1,184 @@
+"""Tests for setup_data.py (run with: python -m unittest discover tests)."""
+
+import contextlib
+import io
+import json
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import setup_data  # noqa: E402
+
+
+def _write_workbook(path, sheets):
+    """Write {sheet_name: [header_row, *rows]} to an xlsx file."""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    wb.remove(wb.active)
+    for sheet_name, rows in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+
+
+def _coverage_sheets(section_id):
+    """A workbook that passes validate-coverage when section_id(tid) names each topic's handout section."""
+    subject_keys = ('physics', 'math', 'chemistry', 'biology')
+    topic_ids = [f'{key}-t{n}' for key in subject_keys for n in (1, 2, 3)]
+    return {
+        'Subjects': [['subject_key', 'name']] + [[key, key.title()] for key in subject_keys],
+        'Topics': [['topic_id', 'subject_key', 'topic_name']]
+                  + [[tid, tid.split('-')[0], tid] for tid in topic_ids],
+        'Learning_Objectives': [['objective_id', 'topic_id']] + [[f'obj-{tid}', tid] for tid in topic_ids],
+        'Key_Terms': [['term_id', 'topic_id']] + [[f'term-{tid}', tid] for tid in topic_ids],
+        'Study_Content': [['content_id', 'section_id', 'content_type']]
+                         + [[f'cont-{tid}', section_id(tid), 'concept_helper'] for tid in topic_ids],
+        'Quiz_Questions': [['question_id', 'topic_id']]
+                          + [[f'quiz-{tid}-{n}', tid] for tid in topic_ids for n in (1, 2, 3)],
+    }
+
+
+class ValidateCoverageTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _validate(self, sheets):
+        path = os.path.join(self.tmp.name, 'coverage.xlsx')
+        _write_workbook(path, sheets)
+        return setup_data.validate_coverage(path)
+
+    def test_hyphenated_section_suffix_counts_for_its_topic(self):
+        self.assertTrue(self._validate(_coverage_sheets(lambda tid: f'{tid}-intro-1')))
+
+    def test_longer_topic_id_does_not_count_for_its_prefix(self):
+        # 'physics-t1' content sits only under 'physics-t10-...', so physics-t1 lacks handouts
+        sheets = _coverage_sheets(lambda tid: f'{tid}0-s1' if tid == 'physics-t1' else f'{tid}-s1')
+        self.assertFalse(self._validate(sheets))
+
+
+
+class ValidateExcelTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_blank_rows_are_not_reported_as_missing_values(self):
+        sheets = {name: [list(schema['columns']), ['x'] * len(schema['columns'])]
+                  for name, schema in setup_data.SHEET_SCHEMAS.items()}
+        # A fully blank row followed by an incomplete one in Topics
+        sheets['Topics'] += [[None] * len(setup_data.SHEET_SCHEMAS['Topics']['columns']), ['t9']]
+        path = os.path.join(self.tmp.name, 'blank.xlsx')
+        _write_workbook(path, sheets)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            setup_data.validate_excel(path)
+        missing = [line for line in out.getvalue().splitlines() if 'missing a value' in line]
+        self.assertTrue(missing)
+        self.assertTrue(all('1 row(s)' in line for line in missing))
+
+
+class SampleWritersTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        setup_data.get_sample_data()
+
+    def _export(self, write, name):
+        xlsx = os.path.join(self.tmp.name, f'{name}.xlsx')
+        write(xlsx)
+        return setup_data.export_to_json(xlsx)
+
+    @unittest.skipUnless(setup_data.HAS_FAST_EXCEL, 'rustpy-xlsxwriter not installed')
+    def test_fast_writer_reads_back_like_openpyxl(self):
+        with open(self._export(setup_data._create_sample_excel_openpyxl, 'openpyxl'), 'rb') as f:
+            expected = f.read()
+        with open(self._export(setup_data._create_sample_excel_fast, 'fast'), 'rb') as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_integer_columns_export_as_ints(self):
+        with open(self._export(setup_data._create_sample_excel_openpyxl, 'openpyxl')) as f:
+            topics = json.load(f)['Topics']
+        self.assertTrue(all(type(t[col]) is int for t in topics for col in ('order_index', 'duration_minutes')))
+
+
+
+class FrozenSampleTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, 'sample_data.pkl')
+        setup_data.get_sample_data()
+
+    def _write(self, header, payload):
+        with open(self.path, 'wb') as f:
+            f.write(header)
+            pickle.dump(payload, f)
+
+    def test_matching_pickle_loads(self):
+        self._write(setup_data._frozen_header(), setup_data.SAMPLE_DATA)
+        self.assertEqual(setup_data._load_frozen_sample_data(self.path), setup_data.SAMPLE_DATA)
+
+    def test_stale_header_is_not_unpickled(self):
+        self._write(b'studyhub-sample 0000\n', setup_data.SAMPLE_DATA)
+        with unittest.mock.patch('pickle.load') as load:
+            self.assertIsNone(setup_data._load_frozen_sample_data(self.path))
+        load.assert_not_called()
+
+    def test_wrong_shape_or_garbage_falls_back(self):
+        for payload in ({'Subjects': {}}, ['not', 'a', 'dict'], {**setup_data.SAMPLE_DATA, 'Extra': {}}):
+            with self.subTest(payload=type(payload)):
+                self._write(setup_data._frozen_header(), payload)
+                self.assertIsNone(setup_data._load_frozen_sample_data(self.path))
+        with open(self.path, 'wb') as f:
+            f.write(setup_data._frozen_header() + b'not a pickle')
+        self.assertIsNone(setup_data._load_frozen_sample_data(self.path))
+
+
+class ParseArgsTest(unittest.TestCase):
+    def test_output_before_command(self):
+        args = setup_data._parse_args(['-o', 'out.xlsx', 'create-sample'])
+        self.assertEqual((args.command, args.output), ('create-sample', 'out.xlsx'))
+
+    def test_output_after_command(self):
+        args = setup_data._parse_args(['export-json', 'in.xlsx', '--output', 'out.json'])
+        self.assertEqual(args, ('export-json', 'in.xlsx', 'out.json', False))
+
+    def test_attached_and_equals_forms(self):
+        self.assertEqual(setup_data._parse_args(['create-sample', '-oout.xlsx']).output, 'out.xlsx')
+        self.assertEqual(setup_data._parse_args(['--output=out.xlsx', 'create-sample']).output, 'out.xlsx')
+
+    def test_usage_errors_exit_2(self):
+        for argv in (['create-sample', '-o'], ['schema', '--bogus'], ['validate', 'a.xlsx', 'b.xlsx']):
+            with self.subTest(argv=argv), self.assertRaises(SystemExit) as cm, \
+                    contextlib.redirect_stderr(io.StringIO()):
+                setup_data._parse_args(argv)
+            self.assertEqual(cm.exception.code, 2)
+
+
+
+class TopicInputTest(unittest.TestCase):
+    def test_content_dict_ignores_unknown_keys(self):
+        content = setup_data._content_from_dict({'sec_idx': 2, 'type': 'text', 'text': 'x', 'note': 'extra'})
+        self.assertEqual(content, setup_data.Content(2, 'text', '', 'x'))
+
+    def test_formula_with_more_than_three_variables_is_rejected(self):
+        setup_data.get_sample_data()
+        before = {name: len(next(iter(t.values()))) for name, t in setup_data.SAMPLE_DATA.items()}
+        variables = tuple(setup_data.Var(symbol, symbol, '') for symbol in 'abcd')
+        with self.assertRaises(ValueError):
+            setup_data.add_topic_data('zz-t1', [('S', 'Zap', 'content')], [], [], [],
+                                      [setup_data.Formula('a+b+c+d', 'Sum', variables)], [])
+        after = {name: len(next(iter(t.values()))) for name, t in setup_data.SAMPLE_DATA.items()}
+        self.assertEqual(after, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
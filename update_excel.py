@@ -1,8 +1,79 @@
 import pandas as pd
-import json
 import os
 import shutil
 
+# Optional fast JSON decoder (pip install orjson); both accept UTF-8 bytes
+try:
+    from orjson import loads as _loads_json
+except ImportError:
+    from json import loads as _loads_json
+
+def _dedup_headers(headers):
+    """Rename repeated headers to 'name.1', 'name.2', ... as pd.read_excel does.
+
+    Like pandas, a suffix that is already some other column's header is skipped.
+    """
+    given = set(headers)
+    counts = {}
+    deduped = []
+    for header in headers:
+        base = header
+        count = counts.get(base, 0)
+        while count:
+            counts[base] = count + 1
+            header = f'{base}.{count}'
+            count = count + 1 if header in given else counts.get(header, 0)
+        deduped.append(header)
+        counts[header] = count + 1
+    return deduped
+
+def _read_all_sheets(excel_path):
+    """Read every sheet into a DataFrame via openpyxl's read-only mode."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+    sheets = {}
+    for ws in wb.worksheets:
+        rows = list(ws.iter_rows(values_only=True))
+        # Trim the trailing empty rows and columns read-only mode reports
+        # from the sheet dimensions, as pd.read_excel does
+        while rows and all(v is None for v in rows[-1]):
+            rows.pop()
+        width = max((len(row) - next(i for i, v in enumerate(reversed(row)) if v is not None)
+                     for row in rows if any(v is not None for v in row)), default=0)
+        headers = _dedup_headers([h if h is not None else f'Unnamed: {i}'
+                                  for i, h in enumerate(rows[0][:width])]) if rows else []
+        sheets[ws.title] = pd.DataFrame([row[:width] for row in rows[1:]], columns=headers)
+    wb.close()
+    return sheets
+
+def _write_all_sheets(excel_path, sheets):
+    """Stream every DataFrame to excel_path via openpyxl's write-only mode."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+
+    wb = Workbook(write_only=True)
+    # Same header look DataFrame.to_excel gave it: bold, thin border, centred
+    thin = Side(style='thin')
+    header_font = Font(bold=True)
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    header_alignment = Alignment(horizontal='center', vertical='top')
+    for sheet_name, df in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        header = []
+        for col in df.columns:
+            cell = WriteOnlyCell(ws, value=str(col))
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header.append(cell)
+        ws.append(header)
+        # Blank cells come back from pandas as NaN; write them as empty cells
+        for row in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(excel_path)
+
 def update_excel():
     # File paths
     json_path = 'content_update_v3.json'
@@ -12,8 +83,8 @@ def update_excel():
     # ... (skipping load logic which is same) ...
     # Load JSON data
     print("Loading JSON data...")
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    with open(json_path, 'rb') as f:
+        data = _loads_json(f.read())
         
     # (Backup logic same) ...
     if os.path.exists(excel_path):
@@ -21,14 +92,21 @@ def update_excel():
     
     # Load Excel ...
     try:
-        xls = pd.read_excel(excel_path, sheet_name=None)
+        xls = _read_all_sheets(excel_path)
     except:
         xls = {} # Basic fallback
 
-    # Prepare lists for new rows
-    sections_rows = []
-    content_rows = []
-    questions_rows = []
+    # Prepare column lists for new rows (one list per column, so pandas
+    # builds each DataFrame straight from {col: list})
+    sections_cols = {col: [] for col in ('topic_id', 'section_id', 'title', 'icon',
+                                         'section_type', 'order_index')}
+    content_cols = {col: [] for col in ('content_id', 'section_id', 'content_type',
+                                        'content_title', 'content_text', 'video_url',
+                                        'image_url', 'description', 'order_index')}
+    questions_cols = {col: [] for col in ('question_id', 'topic_id', 'question_text',
+                                          'option_a', 'option_b', 'option_c', 'option_d',
+                                          'correct_answer', 'explanation', 'difficulty',
+                                          'hint', 'xp_reward', 'image_url')}
     
     for subject_data in data:
         topic_id = subject_data.get('topicId')
@@ -37,95 +115,95 @@ def update_excel():
         # Process Sections
         if 'sections' in subject_data:
             for section in subject_data['sections']:
-                sections_rows.append({
-                    'topic_id': topic_id,
-                    'section_id': section.get('id'),
-                    'title': section.get('title'),
-                    'icon': section.get('icon', 'BookOpen'),
-                    'section_type': section.get('type', 'content'),
-                    'order_index': section.get('order', 1)
-                })
+                sections_cols['topic_id'].append(topic_id)
+                sections_cols['section_id'].append(section.get('id'))
+                sections_cols['title'].append(section.get('title'))
+                sections_cols['icon'].append(section.get('icon', 'BookOpen'))
+                sections_cols['section_type'].append(section.get('type', 'content'))
+                sections_cols['order_index'].append(section.get('order', 1))
 
         # Process Content
         if 'content' in subject_data:
             for idx, item in enumerate(subject_data['content']):
-                content_rows.append({
-                    'content_id': f"cont-{topic_id}-{idx+200}", # Changed offset for v3
-                    'section_id': item.get('sectionId'),
-                    'content_type': item.get('type', 'text'),
-                    'content_title': item.get('title', 'Info'),
-                    'content_text': item.get('text', ''),
-                    'video_url': item.get('videoUrl', ''),
-                    'image_url': item.get('imageUrl', ''),
-                    'description': item.get('description', ''),
-                    'order_index': idx + 1
-                })
+                content_cols['content_id'].append(f"cont-{topic_id}-{idx+200}") # Changed offset for v3
+                content_cols['section_id'].append(item.get('sectionId'))
+                content_cols['content_type'].append(item.get('type', 'text'))
+                content_cols['content_title'].append(item.get('title', 'Info'))
+                content_cols['content_text'].append(item.get('text', ''))
+                content_cols['video_url'].append(item.get('videoUrl', ''))
+                content_cols['image_url'].append(item.get('imageUrl', ''))
+                content_cols['description'].append(item.get('description', ''))
+                content_cols['order_index'].append(idx + 1)
 
         # Process Questions
         if 'questions' in subject_data:
             for idx, q in enumerate(subject_data['questions']):
-                questions_rows.append({
-                    'question_id': f"quiz-{topic_id}-{idx+100}",
-                    'topic_id': topic_id,
-                    'question_text': q.get('question'),
-                    'option_a': q['options'][0],
-                    'option_b': q['options'][1],
-                    'option_c': q['options'][2],
-                    'option_d': q['options'][3],
-                    'correct_answer': q.get('correctAnswer'),
-                    'explanation': q.get('explanation'),
-                    'difficulty': q.get('difficulty'),
-                    'hint': q.get('hint'),
-                    'xp_reward': 10,
-                    'image_url': ''
-                })
+                options = q['options']
+                questions_cols['question_id'].append(f"quiz-{topic_id}-{idx+100}")
+                questions_cols['topic_id'].append(topic_id)
+                questions_cols['question_text'].append(q.get('question'))
+                questions_cols['option_a'].append(options[0])
+                questions_cols['option_b'].append(options[1])
+                questions_cols['option_c'].append(options[2])
+                questions_cols['option_d'].append(options[3])
+                questions_cols['correct_answer'].append(q.get('correctAnswer'))
+                questions_cols['explanation'].append(q.get('explanation'))
+                questions_cols['difficulty'].append(q.get('difficulty'))
+                questions_cols['hint'].append(q.get('hint'))
+                questions_cols['xp_reward'].append(10)
+                questions_cols['image_url'].append('')
 
     # Update Topic_Sections Sheet
-    if sections_rows:
-        print(f"Updating Topic_Sections with {len(sections_rows)} new items...")
-        df_new_sections = pd.DataFrame(sections_rows)
+    if sections_cols['topic_id']:
+        print(f"Updating Topic_Sections with {len(sections_cols['topic_id'])} new items...")
+        df_new_sections = pd.DataFrame(sections_cols)
         if 'Topic_Sections' in xls:
             # Remove existing sections for these topics to avoid duplicates
-            target_topics = set(row['topic_id'] for row in sections_rows)
-            xls['Topic_Sections'] = xls['Topic_Sections'][~xls['Topic_Sections']['topic_id'].isin(target_topics)]
-            xls['Topic_Sections'] = pd.concat([xls['Topic_Sections'], df_new_sections], ignore_index=True)
+            target_topics = set(sections_cols['topic_id'])
+            existing = xls['Topic_Sections']
+            xls['Topic_Sections'] = pd.concat([existing[~existing['topic_id'].isin(target_topics)], df_new_sections],
+                                              ignore_index=True, sort=False)
         else:
-             xls['Topic_Sections'] = df_new_sections
+            xls['Topic_Sections'] = df_new_sections
 
     # Update Study_Content Sheet
-    if content_rows:
-        print(f"Updating Study_Content with {len(content_rows)} new items...")
-        df_new_content = pd.DataFrame(content_rows)
+    if content_cols['content_id']:
+        print(f"Updating Study_Content with {len(content_cols['content_id'])} new items...")
+        df_new_content = pd.DataFrame(content_cols)
         # Extract topic_id from content_id or section_id to filter? 
         # Easier to filter by checking if section_id belongs to target topics. 
         # But section_id is 'phys-t001-s001'. Starts with topic_id.
         if 'Study_Content' in xls:
-            target_topics = set(row['topic_id'] for row in sections_rows) # Use sections_rows to get updated topic IDs
+            target_topics = set(sections_cols['topic_id']) # Use sections_cols to get updated topic IDs
             # Filter: Check if 'topic_id' column exists? No, Study_Content has section_id.
-            # We filter rows where section_id starts with any target_topic
-            mask = xls['Study_Content']['section_id'].apply(lambda x: any(str(x).startswith(t) for t in target_topics))
-            xls['Study_Content'] = xls['Study_Content'][~mask]
-            
-            xls['Study_Content'] = pd.concat([xls['Study_Content'], df_new_content], ignore_index=True)
+            # We filter rows where section_id is a target_topic or starts with
+            # one followed by '-': each '-'-bounded prefix of the ids is hashed
+            # against target_topics with isin (one pass per id depth, whatever
+            # the number of topics), and 'phys-t1' never catches 'phys-t10-s001'
+            existing = xls['Study_Content']
+            parts = existing['section_id'].astype(str).str.split('-')
+            mask = pd.Series(False, index=existing.index)
+            for depth in range(1, int(parts.str.len().max()) + 1 if len(parts) else 1):
+                mask |= parts.str[:depth].str.join('-').isin(target_topics)
+            xls['Study_Content'] = pd.concat([existing[~mask], df_new_content], ignore_index=True, sort=False)
         else:
             xls['Study_Content'] = df_new_content
 
     # Update Quiz_Questions Sheet
-    if questions_rows:
-        print(f"Updating Quiz_Questions with {len(questions_rows)} new items...")
-        df_new_questions = pd.DataFrame(questions_rows)
+    if questions_cols['question_id']:
+        print(f"Updating Quiz_Questions with {len(questions_cols['question_id'])} new items...")
+        df_new_questions = pd.DataFrame(questions_cols)
         if 'Quiz_Questions' in xls:
-            target_topics = set(row['topic_id'] for row in questions_rows)
-            xls['Quiz_Questions'] = xls['Quiz_Questions'][~xls['Quiz_Questions']['topic_id'].isin(target_topics)]
-            xls['Quiz_Questions'] = pd.concat([xls['Quiz_Questions'], df_new_questions], ignore_index=True)
+            target_topics = set(questions_cols['topic_id'])
+            existing = xls['Quiz_Questions']
+            xls['Quiz_Questions'] = pd.concat([existing[~existing['topic_id'].isin(target_topics)], df_new_questions],
+                                              ignore_index=True, sort=False)
         else:
             xls['Quiz_Questions'] = df_new_questions
 
     # Save
     print("Saving updated Excel file...")
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        for sheet_name, df in xls.items():
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    _write_all_sheets(excel_path, xls)
             
     print("Update complete successfully!")
 